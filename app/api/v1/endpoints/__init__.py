@@ -1,2 +1,2 @@
 # API Endpoints
-from app.api.v1.endpoints import auth, profile, projects, posts, skills, experience, contact, upload
+from app.api.v1.endpoints import auth, profile, projects, posts, skills, experience, contact, upload, admin, portfolio, search, tags
@@ -0,0 +1,110 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import response_cache, invalidate
+from app.core.compression import compressed_memo
+from app.core.principals import principal_cache
+from app.core.startup import startup_timer
+from app.db.database import engine, read_engine, replica_router, pool_stats, get_db
+from app.db import search, tags
+from app.db.content_io import InvalidImport, export_stream, import_lines, iter_lines
+from app.core.security import get_current_admin_user, get_hash_stats
+
+router = APIRouter()
+
+@router.get("/cache")
+async def get_cache_stats(current_user: dict = Depends(get_current_admin_user)):
+    """Hit/miss counters for the public response cache"""
+    return {**response_cache.stats(), "compressed": compressed_memo.stats()}
+
+@router.delete("/cache")
+async def clear_cache(current_user: dict = Depends(get_current_admin_user)):
+    response_cache.clear()
+    compressed_memo.clear()
+    return {"message": "Cache cleared"}
+
+@router.get("/db/pool")
+async def get_pool_stats(current_user: dict = Depends(get_current_admin_user)):
+    """Connection pool statistics for the active engine profile"""
+    stats = {"primary": pool_stats(engine)}
+    if read_engine is not engine:
+        stats["read"] = pool_stats(read_engine)
+    if replica_router.replicas:
+        stats["replicas"] = replica_router.stats()
+    return stats
+
+@router.get("/auth/principals")
+async def get_principal_stats(current_user: dict = Depends(get_current_admin_user)):
+    """Counters for the verified token cache"""
+    return principal_cache.stats()
+
+@router.delete("/auth/principals")
+async def clear_principals(current_user: dict = Depends(get_current_admin_user)):
+    principal_cache.clear()
+    return {"message": "Token cache cleared"}
+
+@router.get("/auth/hashing")
+async def get_hashing_stats(current_user: dict = Depends(get_current_admin_user)):
+    """Password hashing pool load and fast-fail counters"""
+    return get_hash_stats()
+
+@router.get("/startup")
+async def get_startup_report(current_user: dict = Depends(get_current_admin_user)):
+    """Cold-start duration of this process by phase"""
+    return startup_timer.report()
+
+@router.post("/search/rebuild")
+async def rebuild_search_index(
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """Re-index every published post and project"""
+    if not search.supported(db):
+        raise HTTPException(status_code=501, detail="Search is not available on this database")
+    documents = await search.rebuild(db)
+    await db.commit()
+    invalidate("/search")
+    return {"documents": documents}
+
+@router.post("/tags/rebuild")
+async def rebuild_tag_index(
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """Rebuild the tag index from the post, project and experience rows"""
+    rows = await tags.rebuild(db)
+    await db.commit()
+    invalidate("/tags", "/posts", "/projects", "/experience")
+    return {"tags": rows}
+
+@router.get("/export")
+async def export_content(current_user: dict = Depends(get_current_admin_user)):
+    """Stream all CMS content (no users) as NDJSON"""
+    return StreamingResponse(
+        export_stream(read_engine),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-store",
+            "Content-Disposition": 'attachment; filename="portfolio-content.ndjson"',
+        },
+    )
+
+@router.post("/import")
+async def import_content(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user),
+):
+    """Upsert an NDJSON export: by slug where a table has one, else by id"""
+    try:
+        counts = await import_lines(db, iter_lines(request.stream()))
+    except InvalidImport as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response_cache.clear()
+    compressed_memo.clear()
+    invalidate(
+        "/profile", "/projects", "/posts", "/skills", "/experience",
+        "/testimonials", "/services", "/portfolio", "/search", "/tags",
+    )
+    return {"tables": counts, "rows": sum(counts.values())}
@@ -8,8 +8,8 @@ from app.db.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, Token
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     get_current_user,
 )
@@ -19,6 +19,9 @@ router = APIRouter()
 
 @router.post("/register", response_model=UserResponse)
 async def register(user_in: UserCreate, db: AsyncSession = Depends(get_db)):
+    # Hash before touching the session so no connection is held meanwhile
+    hashed_password = await get_password_hash_async(user_in.password)
+    
     # Check if user exists
     result = await db.execute(select(User).where(User.email == user_in.email))
     if result.scalar_one_or_none():
@@ -30,7 +33,7 @@ async def register(user_in: UserCreate, db: AsyncSession = Depends(get_db)):
     # Create user
     user = User(
         email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=hashed_password,
         full_name=user_in.full_name,
         is_admin=user_in.email == settings.ADMIN_EMAIL
     )
@@ -47,8 +50,11 @@ async def login(
     # Find user
     result = await db.execute(select(User).where(User.email == form_data.username))
     user = result.scalar_one_or_none()
+    # Return the connection before the slow hash check; with SQLite
+    # performance mode there is a single writer connection
+    await db.close()
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -69,12 +75,6 @@ async def login(
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(
-    current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    result = await db.execute(select(User).where(User.email == current_user["email"]))
-    user = result.scalar_one_or_none()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    return user
+async def get_current_user_info(current_user: dict = Depends(get_current_user)):
+    # The principal already carries every UserResponse field
+    return current_user
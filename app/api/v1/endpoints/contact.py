@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, func, case
 from typing import List
 
 from app.db.database import get_db
+from app.db.pagination import PageParams, paginate
 from app.models.contact import Contact
-from app.schemas.contact import ContactCreate, ContactUpdate, ContactResponse
+from app.schemas.contact import ContactCreate, ContactUpdate, ContactResponse, ContactPage
 from app.core.security import get_current_admin_user
 
 router = APIRouter()
@@ -22,24 +23,32 @@ async def create_contact(
     await db.refresh(contact)
     return contact
 
-@router.get("", response_model=dict)
+@router.get("", response_model=ContactPage)
 async def get_contacts(
     db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(),
     current_user: dict = Depends(get_current_admin_user)
 ):
     """Admin endpoint to get all contacts"""
-    result = await db.execute(
-        select(Contact).order_by(desc(Contact.created_at))
+    # Total and unread in a single aggregate query
+    counts = await db.execute(
+        select(
+            func.count(Contact.id),
+            func.coalesce(func.sum(case((Contact.is_read == False, 1), else_=0)), 0),
+        )
     )
-    contacts = result.scalars().all()
+    total, unread_count = counts.one()
     
-    # Count unread
-    unread_result = await db.execute(
-        select(Contact).where(Contact.is_read == False)
+    page.count = "none"
+    result = await paginate(
+        db,
+        select(Contact),
+        Contact,
+        [(Contact.created_at, True), (Contact.id, True)],
+        page,
     )
-    unread_count = len(unread_result.scalars().all())
-    
-    return {"data": contacts, "total": len(contacts), "unread": unread_count}
+    result.update(total=total, unread=unread_count)
+    return result
 
 @router.get("/{id}", response_model=ContactResponse)
 async def get_contact(
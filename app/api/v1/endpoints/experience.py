@@ -1,30 +1,123 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List
+from typing import List, Optional
 
-from app.db.database import get_db
-from app.models.experience import Experience
-from app.schemas.experience import ExperienceCreate, ExperienceUpdate, ExperienceResponse
+from app.db.database import get_db, get_read_db
+from app.db.pagination import PageParams, paginate
+from app.db.bulk import check_batch, check_unique, delete_many, existing, insert_many, reorder, update_many
+from app.db.tags import remove_tags, sync_tags, tagged
+from app.models.experience import Experience, start_date_key
+from app.schemas.experience import ExperienceCreate, ExperienceUpdate, ExperienceBulkUpdate, ExperienceResponse
+from app.schemas.bulk import IdList, BulkResult, ReorderResult
+from app.schemas.pagination import Page
 from app.core.security import get_current_admin_user
+from app.core.cache import invalidate
+from app.core.serialization import render
+from app.core.http_cache import collection_validator, conditional_response
 
 router = APIRouter()
 
-@router.get("", response_model=dict)
-async def get_experiences(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Experience).order_by(Experience.order, Experience.start_date.desc())
-    )
-    experiences = result.scalars().all()
-    return {"data": experiences, "total": len(experiences)}
+# start_date_key coalesces the nullable start_date so the keyset comparison stays total
+SORT_KEYS = [
+    (Experience.order, False),
+    (start_date_key, True),
+    (Experience.id, False),
+]
+
+@router.get("", response_model=Page[ExperienceResponse])
+async def get_experiences(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    page: PageParams = Depends(),
+    skill: Optional[str] = None,
+):
+    query = select(Experience)
+    
+    if skill:
+        query = query.where(tagged("experience", Experience, skill))
+    
+    validator = await collection_validator(db, request, Experience)
+    not_modified = conditional_response(request, response, validator, "list")
+    if not_modified:
+        return not_modified
+    
+    result = await paginate(db, query, Experience, SORT_KEYS, page)
+    return render(Page[ExperienceResponse], result, response)
+
+@router.post("/batch", response_model=List[ExperienceResponse])
+async def create_experiences(
+    experiences_in: List[ExperienceCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    check_batch(experiences_in)
+    experiences = await insert_many(db, Experience, [item.model_dump() for item in experiences_in])
+    for experience in experiences:
+        await sync_tags(db, "experience", experience)
+    await db.commit()
+    invalidate("/experience", *(f"/experience/{item.id}" for item in experiences), "/portfolio", "/tags")
+    return experiences
+
+@router.put("/batch", response_model=List[BulkResult])
+async def update_experiences(
+    experiences_in: List[ExperienceBulkUpdate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    check_batch(experiences_in)
+    ids = [item.id for item in experiences_in]
+    check_unique(ids)
+    found = await existing(db, Experience, ids)
+    rows = [item.model_dump(exclude_unset=True) for item in experiences_in]
+    results = await update_many(db, Experience, rows, found)
+    
+    # Re-index tags only where the skills changed
+    retag = [row["id"] for row in rows if row["id"] in found and "skills" in row]
+    if retag:
+        for experience in (await db.scalars(select(Experience).where(Experience.id.in_(retag)))).all():
+            await sync_tags(db, "experience", experience)
+    await db.commit()
+    invalidate("/experience", *(f"/experience/{id}" for id in found), "/portfolio", "/tags")
+    return results
+
+@router.post("/batch/delete", response_model=List[BulkResult])
+async def delete_experiences(
+    body: IdList,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    check_batch(body.ids)
+    check_unique(body.ids)
+    for id in await existing(db, Experience, body.ids):
+        await remove_tags(db, "experience", id)
+    results = await delete_many(db, Experience, body.ids)
+    await db.commit()
+    invalidate("/experience", *(f"/experience/{id}" for id in body.ids), "/portfolio", "/tags")
+    return results
+
+@router.put("/order", response_model=List[ReorderResult])
+async def reorder_experiences(
+    body: IdList,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """Set `order` from the position of each id in `ids`"""
+    check_batch(body.ids)
+    check_unique(body.ids)
+    results = await reorder(db, Experience, body.ids)
+    await db.commit()
+    invalidate("/experience", *(f"/experience/{id}" for id in body.ids), "/portfolio")
+    return results
 
 @router.get("/{id}", response_model=ExperienceResponse)
-async def get_experience(id: int, db: AsyncSession = Depends(get_db)):
+async def get_experience(id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(Experience).where(Experience.id == id))
     experience = result.scalar_one_or_none()
     if not experience:
         raise HTTPException(status_code=404, detail="Experience not found")
-    return experience
+    return render(ExperienceResponse, experience)
 
 @router.post("", response_model=ExperienceResponse)
 async def create_experience(
@@ -34,8 +127,11 @@ async def create_experience(
 ):
     experience = Experience(**experience_in.model_dump())
     db.add(experience)
+    await db.flush()
+    await sync_tags(db, "experience", experience)
     await db.commit()
     await db.refresh(experience)
+    invalidate("/experience", f"/experience/{experience.id}", "/portfolio", "/tags")
     return experience
 
 @router.put("/{id}", response_model=ExperienceResponse)
@@ -55,8 +151,10 @@ async def update_experience(
     for field, value in update_data.items():
         setattr(experience, field, value)
     
+    await sync_tags(db, "experience", experience)
     await db.commit()
     await db.refresh(experience)
+    invalidate("/experience", f"/experience/{id}", "/portfolio", "/tags")
     return experience
 
 @router.delete("/{id}")
@@ -71,7 +169,9 @@ async def delete_experience(
     if not experience:
         raise HTTPException(status_code=404, detail="Experience not found")
     
+    await remove_tags(db, "experience", experience.id)
     await db.delete(experience)
     await db.commit()
+    invalidate("/experience", f"/experience/{id}", "/portfolio", "/tags")
     
     return {"message": "Experience deleted successfully"}
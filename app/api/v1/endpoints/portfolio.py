@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import Optional
+
+from app.db.database import get_read_db
+from app.db.pagination import PageParams, paginate
+from app.models.profile import Profile
+from app.models.project import Project
+from app.models.skill import Skill
+from app.models.experience import Experience
+from app.models.testimonial import Testimonial
+from app.models.service import Service
+from app.schemas.portfolio import PortfolioBundle
+from app.core.http_cache import CACHE_POLICIES
+from app.api.v1.endpoints import projects, skills, experience, testimonials, services
+
+router = APIRouter()
+
+SECTIONS = ("profile", "projects", "skills", "experience", "testimonials", "services")
+
+# Same filters and ordering as the individual list endpoints
+SECTION_QUERIES = {
+    "projects": (
+        select(Project).where(Project.is_published == True, Project.is_featured == True),
+        Project,
+        projects.SORT_KEYS,
+    ),
+    "skills": (select(Skill).where(Skill.is_active == True), Skill, skills.SORT_KEYS),
+    "experience": (select(Experience), Experience, experience.SORT_KEYS),
+    "testimonials": (select(Testimonial), Testimonial, testimonials.SORT_KEYS),
+    "services": (select(Service), Service, services.SORT_KEYS),
+}
+
+@router.get("", response_model=PortfolioBundle, response_model_exclude_unset=True)
+async def get_portfolio(
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    sections: Optional[str] = Query(
+        None, description=f"Comma-separated subset of: {', '.join(SECTIONS)}"
+    ),
+    limit: int = Query(100, ge=1, le=100, description="Maximum items per list section"),
+):
+    """Everything the landing page needs in one request and one session"""
+    requested = SECTIONS
+    if sections:
+        requested = tuple(s.strip() for s in sections.split(",") if s.strip())
+        unknown = set(requested) - set(SECTIONS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown sections: {', '.join(sorted(unknown))}"
+            )
+    
+    bundle = {}
+    page = PageParams(cursor=None, skip=0, limit=limit, count="none")
+    for section in requested:
+        if section == "profile":
+            result = await db.execute(select(Profile).limit(1))
+            bundle["profile"] = result.scalar_one_or_none()
+        else:
+            query, model, sort_keys = SECTION_QUERIES[section]
+            bundle[section] = (await paginate(db, query, model, sort_keys, page))["data"]
+    
+    # Cached as one unit by the response cache; writes to any section invalidate it
+    response.headers["Cache-Control"] = CACHE_POLICIES["list"]
+    return bundle
@@ -1,55 +1,87 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from functools import partial
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
-from typing import List, Optional
-from slugify import slugify
+from sqlalchemy import select
+from typing import Optional
 
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
+from app.db.pagination import PageParams, paginate
+from app.db.projection import project_columns
+from app.db.search import index_post, remove_document
+from app.db.tags import remove_tags, sync_tags, tagged
+from app.db.versions import version_column
+from app.db.view_counter import post_views
 from app.models.post import Post
-from app.schemas.post import PostCreate, PostUpdate, PostResponse
+from app.schemas.post import PostCreate, PostUpdate, PostResponse, PostSummary
+from app.schemas.pagination import Page
 from app.core.security import get_current_admin_user
+from app.core.cache import invalidate, is_internal, on_cache_hit
+from app.core.serialization import render
+from app.core.http_cache import Validator, collection_validator, conditional_response, make_etag
 
 router = APIRouter()
 
-@router.get("", response_model=dict)
+SORT_KEYS = [(Post.created_at, True), (Post.id, True)]
+
+@router.get("", response_model=Page[PostResponse])
 async def get_posts(
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    page: PageParams = Depends(),
     category: Optional[str] = None,
+    tag: Optional[str] = None,
+    view: str = Query("full", pattern="^(summary|full)$"),
+    fields: Optional[str] = Query(None, description="Comma-separated response fields"),
 ):
+    # Select only the columns the response needs
+    projection = project_columns(Post, PostSummary if view == "summary" else PostResponse, fields)
     query = select(Post).where(Post.is_published == True)
     
     if category:
         query = query.where(Post.category == category)
+    if tag:
+        query = query.where(tagged("post", Post, tag))
     
-    query = query.order_by(desc(Post.created_at)).offset(skip).limit(limit)
-    
-    result = await db.execute(query)
-    posts = result.scalars().all()
-    
-    # Get total count
-    count_query = select(Post).where(Post.is_published == True)
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+    validator = await collection_validator(db, request, Post)
+    not_modified = conditional_response(request, response, validator, "list")
+    if not_modified:
+        return not_modified
     
-    return {"data": posts, "total": total}
+    query = query.with_only_columns(*projection.columns)
+    result = await paginate(db, query, Post, SORT_KEYS, page)
+    return render(Page[projection.schema], result, response)
 
 @router.get("/{slug}", response_model=PostResponse)
-async def get_post(slug: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Post).where(Post.slug == slug, Post.is_published == True)
-    )
-    post = result.scalar_one_or_none()
-    if not post:
+async def get_post(
+    slug: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
+    # Check validators against the version columns before loading the body
+    version = (await db.execute(
+        select(Post.id, Post.created_at, Post.updated_at, Post.views, version_column(Post))
+        .where(Post.slug == slug, Post.is_published == True)
+    )).one_or_none()
+    if not version:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    # Increment views
-    post.views += 1
-    await db.commit()
-    await db.refresh(post)
+    # Views are buffered and flushed in batches; the read path never writes
+    if not is_internal(request.scope):
+        post_views.record(version.id)
+    on_cache_hit(request, partial(post_views.record, version.id))
     
-    return post
+    validator = Validator(
+        make_etag(request.url.path, *version),
+        version.updated_at or version.created_at,
+    )
+    not_modified = conditional_response(request, response, validator, "post")
+    if not_modified:
+        return not_modified
+    
+    result = await db.execute(select(Post).where(Post.id == version.id))
+    return render(PostResponse, result.scalar_one(), response)
 
 @router.post("", response_model=PostResponse)
 async def create_post(
@@ -57,6 +89,8 @@ async def create_post(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_admin_user)
 ):
+    from slugify import slugify
+    
     # Generate slug if not provided
     slug = post_in.slug or slugify(post_in.title)
     
@@ -70,8 +104,12 @@ async def create_post(
     
     post = Post(**post_data)
     db.add(post)
+    await db.flush()
+    await index_post(db, post)
+    await sync_tags(db, "post", post)
     await db.commit()
     await db.refresh(post)
+    invalidate("/posts", f"/posts/{post.slug}", "/search", "/tags")
     return post
 
 @router.put("/{id}", response_model=PostResponse)
@@ -87,17 +125,22 @@ async def update_post(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
+    old_slug = post.slug
     update_data = post_in.model_dump(exclude_unset=True)
     
     # Update slug if title changed
     if "title" in update_data and "slug" not in update_data:
+        from slugify import slugify
         update_data["slug"] = slugify(update_data["title"])
     
     for field, value in update_data.items():
         setattr(post, field, value)
     
+    await index_post(db, post)
+    await sync_tags(db, "post", post)
     await db.commit()
     await db.refresh(post)
+    invalidate("/posts", f"/posts/{old_slug}", f"/posts/{post.slug}", "/search", "/tags")
     return post
 
 @router.delete("/{id}")
@@ -112,7 +155,10 @@ async def delete_post(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
+    await remove_document(db, "post", post.id)
+    await remove_tags(db, "post", post.id)
     await db.delete(post)
     await db.commit()
+    invalidate("/posts", f"/posts/{post.slug}", "/search", "/tags")
     
     return {"message": "Post deleted successfully"}
@@ -1,21 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
+from app.db.versions import version_column
 from app.models.profile import Profile
 from app.schemas.profile import ProfileCreate, ProfileUpdate, ProfileResponse
 from app.core.security import get_current_admin_user
+from app.core.cache import invalidate
+from app.core.http_cache import Validator, conditional_response, make_etag
 
 router = APIRouter()
 
 @router.get("", response_model=ProfileResponse)
-async def get_profile(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Profile).limit(1))
-    profile = result.scalar_one_or_none()
-    if not profile:
+async def get_profile(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
+    version = (await db.execute(
+        select(Profile.id, Profile.created_at, Profile.updated_at, version_column(Profile)).limit(1)
+    )).one_or_none()
+    if not version:
         raise HTTPException(status_code=404, detail="Profile not found")
-    return profile
+    
+    validator = Validator(
+        make_etag(request.url.path, *version),
+        version.updated_at or version.created_at,
+    )
+    not_modified = conditional_response(request, response, validator, "profile")
+    if not_modified:
+        return not_modified
+    
+    result = await db.execute(select(Profile).where(Profile.id == version.id))
+    return result.scalar_one()
 
 @router.post("", response_model=ProfileResponse)
 async def create_profile(
@@ -32,6 +50,7 @@ async def create_profile(
     db.add(profile)
     await db.commit()
     await db.refresh(profile)
+    invalidate("/profile", "/portfolio")
     return profile
 
 @router.put("", response_model=ProfileResponse)
@@ -55,4 +74,5 @@ async def update_profile(
     
     await db.commit()
     await db.refresh(profile)
+    invalidate("/profile", "/portfolio")
     return profile
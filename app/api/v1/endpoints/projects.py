@@ -1,54 +1,178 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select
 from typing import List, Optional
-from slugify import slugify
 
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
+from app.db.pagination import PageParams, paginate
+from app.db.bulk import check_batch, check_unique, delete_many, existing, insert_many, reorder, update_many
+from app.db.projection import project_columns
+from app.db.search import index_project, remove_document
+from app.db.tags import remove_tags, sync_tags, tagged
+from app.db.versions import version_column
 from app.models.project import Project
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectBulkUpdate, ProjectResponse, ProjectSummary
+from app.schemas.bulk import IdList, BulkResult, ReorderResult
+from app.schemas.pagination import Page
 from app.core.security import get_current_admin_user
+from app.core.cache import invalidate
+from app.core.serialization import render
+from app.core.http_cache import Validator, collection_validator, conditional_response, make_etag
 
 router = APIRouter()
 
-@router.get("", response_model=dict)
+SORT_KEYS = [(Project.order, False), (Project.created_at, True), (Project.id, True)]
+
+@router.get("", response_model=Page[ProjectResponse])
 async def get_projects(
-    db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    page: PageParams = Depends(),
     featured: Optional[bool] = None,
     category: Optional[str] = None,
+    technology: Optional[str] = None,
+    view: str = Query("full", pattern="^(summary|full)$"),
+    fields: Optional[str] = Query(None, description="Comma-separated response fields"),
 ):
+    # Select only the columns the response needs
+    projection = project_columns(Project, ProjectSummary if view == "summary" else ProjectResponse, fields)
     query = select(Project).where(Project.is_published == True)
     
     if featured is not None:
         query = query.where(Project.is_featured == featured)
     if category:
         query = query.where(Project.category == category)
+    if technology:
+        query = query.where(tagged("project", Project, technology))
     
-    query = query.order_by(Project.order, desc(Project.created_at)).offset(skip).limit(limit)
-    
-    result = await db.execute(query)
-    projects = result.scalars().all()
-    
-    # Get total count
-    count_query = select(Project).where(Project.is_published == True)
-    if featured is not None:
-        count_query = count_query.where(Project.is_featured == featured)
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+    validator = await collection_validator(db, request, Project)
+    not_modified = conditional_response(request, response, validator, "list")
+    if not_modified:
+        return not_modified
     
-    return {"data": projects, "total": total}
+    query = query.with_only_columns(*projection.columns)
+    result = await paginate(db, query, Project, SORT_KEYS, page)
+    return render(Page[projection.schema], result, response)
+
+@router.post("/batch", response_model=List[ProjectResponse])
+async def create_projects(
+    projects_in: List[ProjectCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    from slugify import slugify
+    
+    check_batch(projects_in)
+    rows = [{**project_in.model_dump(), "slug": project_in.slug or slugify(project_in.title)} for project_in in projects_in]
+    
+    # Check every slug, in the batch and in the table, with one query
+    slugs = [row["slug"] for row in rows]
+    taken = set((await db.scalars(select(Project.slug).where(Project.slug.in_(slugs)))).all())
+    taken.update(slug for slug in slugs if slugs.count(slug) > 1)
+    if taken:
+        raise HTTPException(status_code=400, detail=f"Projects with these slugs already exist: {', '.join(sorted(taken))}")
+    
+    projects = await insert_many(db, Project, rows)
+    for project in projects:
+        await index_project(db, project)
+        await sync_tags(db, "project", project)
+    await db.commit()
+    invalidate("/projects", *(f"/projects/{project.slug}" for project in projects), "/portfolio", "/search", "/tags")
+    return projects
+
+@router.put("/batch", response_model=List[BulkResult])
+async def update_projects(
+    projects_in: List[ProjectBulkUpdate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    from slugify import slugify
+    
+    check_batch(projects_in)
+    ids = [project_in.id for project_in in projects_in]
+    check_unique(ids)
+    found = await existing(db, Project, ids, Project.slug)
+    rows = [project_in.model_dump(exclude_unset=True) for project_in in projects_in]
+    for row in rows:
+        if "title" in row and "slug" not in row:
+            row["slug"] = slugify(row["title"])
+    
+    # New slugs must not clash with each other or with another project's slug
+    slugs = {row["id"]: row["slug"] for row in rows if row["id"] in found and row.get("slug")}
+    owners = (await db.execute(select(Project.id, Project.slug).where(Project.slug.in_(list(slugs.values()))))).all() if slugs else []
+    taken = {slug for owner, slug in owners if slugs.get(owner) != slug}
+    taken.update(slug for slug in slugs.values() if list(slugs.values()).count(slug) > 1)
+    if taken:
+        raise HTTPException(status_code=400, detail=f"Projects with these slugs already exist: {', '.join(sorted(taken))}")
+    
+    results = await update_many(db, Project, rows, found)
+    
+    projects = (await db.scalars(select(Project).where(Project.id.in_(list(found))))).all() if found else []
+    for project in projects:
+        await index_project(db, project)
+        await sync_tags(db, "project", project)
+    await db.commit()
+    paths = {f"/projects/{row.slug}" for row in found.values()} | {f"/projects/{project.slug}" for project in projects}
+    invalidate("/projects", *paths, "/portfolio", "/search", "/tags")
+    return results
+
+@router.post("/batch/delete", response_model=List[BulkResult])
+async def delete_projects(
+    body: IdList,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    check_batch(body.ids)
+    check_unique(body.ids)
+    found = await existing(db, Project, body.ids, Project.slug)
+    for id in found:
+        await remove_document(db, "project", id)
+        await remove_tags(db, "project", id)
+    results = await delete_many(db, Project, body.ids)
+    await db.commit()
+    invalidate("/projects", *(f"/projects/{row.slug}" for row in found.values()), "/portfolio", "/search", "/tags")
+    return results
+
+@router.put("/order", response_model=List[ReorderResult])
+async def reorder_projects(
+    body: IdList,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """Set `order` from the position of each id in `ids`"""
+    check_batch(body.ids)
+    check_unique(body.ids)
+    results = await reorder(db, Project, body.ids)
+    found = await existing(db, Project, body.ids, Project.slug)
+    await db.commit()
+    invalidate("/projects", *(f"/projects/{row.slug}" for row in found.values()), "/portfolio")
+    return results
 
 @router.get("/{slug}", response_model=ProjectResponse)
-async def get_project(slug: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Project).where(Project.slug == slug, Project.is_published == True)
-    )
-    project = result.scalar_one_or_none()
-    if not project:
+async def get_project(
+    slug: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
+    version = (await db.execute(
+        select(Project.id, Project.created_at, Project.updated_at, version_column(Project))
+        .where(Project.slug == slug, Project.is_published == True)
+    )).one_or_none()
+    if not version:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    
+    validator = Validator(
+        make_etag(request.url.path, *version),
+        version.updated_at or version.created_at,
+    )
+    not_modified = conditional_response(request, response, validator, "detail")
+    if not_modified:
+        return not_modified
+    
+    result = await db.execute(select(Project).where(Project.id == version.id))
+    return render(ProjectResponse, result.scalar_one(), response)
 
 @router.post("", response_model=ProjectResponse)
 async def create_project(
@@ -56,6 +180,8 @@ async def create_project(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_admin_user)
 ):
+    from slugify import slugify
+    
     # Generate slug if not provided
     slug = project_in.slug or slugify(project_in.title)
     
@@ -69,8 +195,12 @@ async def create_project(
     
     project = Project(**project_data)
     db.add(project)
+    await db.flush()
+    await index_project(db, project)
+    await sync_tags(db, "project", project)
     await db.commit()
     await db.refresh(project)
+    invalidate("/projects", f"/projects/{project.slug}", "/portfolio", "/search", "/tags")
     return project
 
 @router.put("/{id}", response_model=ProjectResponse)
@@ -86,17 +216,22 @@ async def update_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
+    old_slug = project.slug
     update_data = project_in.model_dump(exclude_unset=True)
     
     # Update slug if title changed
     if "title" in update_data and "slug" not in update_data:
+        from slugify import slugify
         update_data["slug"] = slugify(update_data["title"])
     
     for field, value in update_data.items():
         setattr(project, field, value)
     
+    await index_project(db, project)
+    await sync_tags(db, "project", project)
     await db.commit()
     await db.refresh(project)
+    invalidate("/projects", f"/projects/{old_slug}", f"/projects/{project.slug}", "/portfolio", "/search", "/tags")
     return project
 
 @router.delete("/{id}")
@@ -111,7 +246,10 @@ async def delete_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
+    await remove_document(db, "project", project.id)
+    await remove_tags(db, "project", project.id)
     await db.delete(project)
     await db.commit()
+    invalidate("/projects", f"/projects/{project.slug}", "/portfolio", "/search", "/tags")
     
     return {"message": "Project deleted successfully"}
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.db.database import get_read_db
+from app.db.search import KINDS, search, supported
+from app.schemas.pagination import Page
+from app.schemas.search import SearchResult
+from app.core.http_cache import CACHE_POLICIES
+
+router = APIRouter()
+
+@router.get("", response_model=Page[SearchResult])
+async def search_content(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    type: Optional[str] = Query(None, pattern="^(post|project)$"),
+    cursor: Optional[str] = Query(None, description="Opaque token from a previous page's next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Ranked full-text search over published posts and projects"""
+    if not supported(db):
+        raise HTTPException(status_code=501, detail="Search is not available on this database")
+    
+    kinds = [type] if type else list(KINDS)
+    response.headers["Cache-Control"] = CACHE_POLICIES["list"]
+    return await search(db, q, kinds, limit, cursor)
@@ -1,14 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import List
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import AsyncSessionLocal
+from app.db.database import AsyncSessionLocal, get_read_db
+from app.db.pagination import PageParams, paginate
+from app.db.bulk import check_batch, check_unique, delete_many, existing, insert_many, update_many
+from app.core.cache import invalidate
+from app.core.http_cache import CACHE_POLICIES
+from app.core.security import get_current_admin_user
 from app.models.service import Service
-from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceOut
+from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceBulkUpdate, ServiceOut
+from app.schemas.bulk import IdList, BulkResult
 
 router = APIRouter()
 
+SORT_KEYS = [(Service.id, False)]
+
 
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
@@ -16,10 +24,20 @@ async def get_db() -> AsyncSession:
 
 
 @router.get("", response_model=List[ServiceOut])
-async def list_services(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Service))
-    items = result.scalars().all()
-    return items
+async def list_services(
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    page: PageParams = Depends(),
+):
+    # The body stays a bare list; page metadata travels in headers.
+    # No timestamps here, so the response cache adds a content-hash ETag.
+    response.headers["Cache-Control"] = CACHE_POLICIES["list"]
+    result = await paginate(db, select(Service), Service, SORT_KEYS, page)
+    if result["total"] is not None:
+        response.headers["X-Total-Count"] = str(result["total"])
+    if result["next_cursor"]:
+        response.headers["X-Next-Cursor"] = result["next_cursor"]
+    return result["data"]
 
 
 @router.post("", response_model=ServiceOut, status_code=status.HTTP_201_CREATED)
@@ -28,11 +46,55 @@ async def create_service(data: ServiceCreate, db: AsyncSession = Depends(get_db)
     db.add(obj)
     await db.commit()
     await db.refresh(obj)
+    invalidate("/services", f"/services/{obj.id}", "/portfolio")
     return obj
 
 
+@router.post("/batch", response_model=List[ServiceOut], status_code=status.HTTP_201_CREATED)
+async def create_services(
+    data: List[ServiceCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user),
+):
+    check_batch(data)
+    objs = await insert_many(db, Service, [item.dict() for item in data])
+    await db.commit()
+    invalidate("/services", *(f"/services/{obj.id}" for obj in objs), "/portfolio")
+    return objs
+
+
+@router.put("/batch", response_model=List[BulkResult])
+async def update_services(
+    data: List[ServiceBulkUpdate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user),
+):
+    check_batch(data)
+    ids = [item.id for item in data]
+    check_unique(ids)
+    found = await existing(db, Service, ids)
+    results = await update_many(db, Service, [item.dict() for item in data], found)
+    await db.commit()
+    invalidate("/services", *(f"/services/{item_id}" for item_id in found), "/portfolio")
+    return results
+
+
+@router.post("/batch/delete", response_model=List[BulkResult])
+async def delete_services(
+    data: IdList,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user),
+):
+    check_batch(data.ids)
+    check_unique(data.ids)
+    results = await delete_many(db, Service, data.ids)
+    await db.commit()
+    invalidate("/services", *(f"/services/{item_id}" for item_id in data.ids), "/portfolio")
+    return results
+
+
 @router.get("/{item_id}", response_model=ServiceOut)
-async def get_service(item_id: int, db: AsyncSession = Depends(get_db)):
+async def get_service(item_id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(Service).where(Service.id == item_id))
     obj = result.scalar_one_or_none()
     if obj is None:
@@ -51,6 +113,7 @@ async def update_service(item_id: int, data: ServiceUpdate, db: AsyncSession = D
     db.add(obj)
     await db.commit()
     await db.refresh(obj)
+    invalidate("/services", f"/services/{item_id}", "/portfolio")
     return obj
 
 
@@ -62,4 +125,5 @@ async def delete_service(item_id: int, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Service not found")
     await db.delete(obj)
     await db.commit()
+    invalidate("/services", f"/services/{item_id}", "/portfolio")
     return None
@@ -1,30 +1,102 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
 
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
+from app.db.pagination import PageParams, paginate
+from app.db.bulk import check_batch, check_unique, delete_many, existing, insert_many, reorder, update_many
 from app.models.skill import Skill
-from app.schemas.skill import SkillCreate, SkillUpdate, SkillResponse
+from app.schemas.skill import SkillCreate, SkillUpdate, SkillBulkUpdate, SkillResponse
+from app.schemas.bulk import IdList, BulkResult, ReorderResult
+from app.schemas.pagination import Page
 from app.core.security import get_current_admin_user
+from app.core.cache import invalidate
+from app.core.serialization import render
+from app.core.http_cache import collection_validator, conditional_response
 
 router = APIRouter()
 
-@router.get("", response_model=dict)
-async def get_skills(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Skill).where(Skill.is_active == True).order_by(Skill.order, Skill.name)
-    )
-    skills = result.scalars().all()
-    return {"data": skills, "total": len(skills)}
+SORT_KEYS = [(Skill.order, False), (Skill.name, False), (Skill.id, False)]
+
+@router.get("", response_model=Page[SkillResponse])
+async def get_skills(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    page: PageParams = Depends(),
+):
+    query = select(Skill).where(Skill.is_active == True)
+    
+    validator = await collection_validator(db, request, Skill)
+    not_modified = conditional_response(request, response, validator, "list")
+    if not_modified:
+        return not_modified
+    
+    result = await paginate(db, query, Skill, SORT_KEYS, page)
+    return render(Page[SkillResponse], result, response)
+
+@router.post("/batch", response_model=List[SkillResponse])
+async def create_skills(
+    skills_in: List[SkillCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    check_batch(skills_in)
+    skills = await insert_many(db, Skill, [skill_in.model_dump() for skill_in in skills_in])
+    await db.commit()
+    invalidate("/skills", *(f"/skills/{skill.id}" for skill in skills), "/portfolio")
+    return skills
+
+@router.put("/batch", response_model=List[BulkResult])
+async def update_skills(
+    skills_in: List[SkillBulkUpdate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    check_batch(skills_in)
+    ids = [skill_in.id for skill_in in skills_in]
+    check_unique(ids)
+    found = await existing(db, Skill, ids)
+    results = await update_many(db, Skill, [skill_in.model_dump(exclude_unset=True) for skill_in in skills_in], found)
+    await db.commit()
+    invalidate("/skills", *(f"/skills/{id}" for id in found), "/portfolio")
+    return results
+
+@router.post("/batch/delete", response_model=List[BulkResult])
+async def delete_skills(
+    body: IdList,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    check_batch(body.ids)
+    check_unique(body.ids)
+    results = await delete_many(db, Skill, body.ids)
+    await db.commit()
+    invalidate("/skills", *(f"/skills/{id}" for id in body.ids), "/portfolio")
+    return results
+
+@router.put("/order", response_model=List[ReorderResult])
+async def reorder_skills(
+    body: IdList,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """Set `order` from the position of each id in `ids`"""
+    check_batch(body.ids)
+    check_unique(body.ids)
+    results = await reorder(db, Skill, body.ids)
+    await db.commit()
+    invalidate("/skills", *(f"/skills/{id}" for id in body.ids), "/portfolio")
+    return results
 
 @router.get("/{id}", response_model=SkillResponse)
-async def get_skill(id: int, db: AsyncSession = Depends(get_db)):
+async def get_skill(id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(Skill).where(Skill.id == id))
     skill = result.scalar_one_or_none()
     if not skill:
         raise HTTPException(status_code=404, detail="Skill not found")
-    return skill
+    return render(SkillResponse, skill)
 
 @router.post("", response_model=SkillResponse)
 async def create_skill(
@@ -36,6 +108,7 @@ async def create_skill(
     db.add(skill)
     await db.commit()
     await db.refresh(skill)
+    invalidate("/skills", f"/skills/{skill.id}", "/portfolio")
     return skill
 
 @router.put("/{id}", response_model=SkillResponse)
@@ -57,6 +130,7 @@ async def update_skill(
     
     await db.commit()
     await db.refresh(skill)
+    invalidate("/skills", f"/skills/{id}", "/portfolio")
     return skill
 
 @router.delete("/{id}")
@@ -73,5 +147,6 @@ async def delete_skill(
     
     await db.delete(skill)
     await db.commit()
+    invalidate("/skills", f"/skills/{id}", "/portfolio")
     
     return {"message": "Skill deleted successfully"}
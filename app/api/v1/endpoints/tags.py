@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Response, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from app.db.database import get_read_db
+from app.db.tags import tag_counts
+from app.schemas.tag import TagCount
+from app.core.http_cache import CACHE_POLICIES
+
+router = APIRouter()
+
+@router.get("", response_model=List[TagCount])
+async def get_tags(
+    response: Response,
+    kind: Optional[str] = Query(None, pattern="^(post|project|experience)$"),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Tag counts for tag clouds, most used first"""
+    response.headers["Cache-Control"] = CACHE_POLICIES["list"]
+    return await tag_counts(db, kind, limit)
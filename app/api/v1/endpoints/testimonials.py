@@ -1,18 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import List
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import AsyncSessionLocal
+from app.db.database import AsyncSessionLocal, get_read_db
+from app.db.pagination import PageParams, paginate
+from app.db.bulk import check_batch, check_unique, delete_many, existing, insert_many, update_many
+from app.core.cache import invalidate
+from app.core.http_cache import CACHE_POLICIES
+from app.core.security import get_current_admin_user
 from app.models.testimonial import Testimonial
 from app.schemas.testimonial import (
     TestimonialCreate,
     TestimonialUpdate,
+    TestimonialBulkUpdate,
     TestimonialOut,
 )
+from app.schemas.bulk import IdList, BulkResult
 
 router = APIRouter()
 
+SORT_KEYS = [(Testimonial.id, False)]
+
 
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
@@ -20,10 +29,20 @@ async def get_db() -> AsyncSession:
 
 
 @router.get("", response_model=List[TestimonialOut])
-async def list_testimonials(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Testimonial))
-    items = result.scalars().all()
-    return items
+async def list_testimonials(
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    page: PageParams = Depends(),
+):
+    # The body stays a bare list; page metadata travels in headers.
+    # No timestamps here, so the response cache adds a content-hash ETag.
+    response.headers["Cache-Control"] = CACHE_POLICIES["list"]
+    result = await paginate(db, select(Testimonial), Testimonial, SORT_KEYS, page)
+    if result["total"] is not None:
+        response.headers["X-Total-Count"] = str(result["total"])
+    if result["next_cursor"]:
+        response.headers["X-Next-Cursor"] = result["next_cursor"]
+    return result["data"]
 
 
 @router.post("", response_model=TestimonialOut, status_code=status.HTTP_201_CREATED)
@@ -32,11 +51,55 @@ async def create_testimonial(data: TestimonialCreate, db: AsyncSession = Depends
     db.add(obj)
     await db.commit()
     await db.refresh(obj)
+    invalidate("/testimonials", f"/testimonials/{obj.id}", "/portfolio")
     return obj
 
 
+@router.post("/batch", response_model=List[TestimonialOut], status_code=status.HTTP_201_CREATED)
+async def create_testimonials(
+    data: List[TestimonialCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user),
+):
+    check_batch(data)
+    objs = await insert_many(db, Testimonial, [item.dict() for item in data])
+    await db.commit()
+    invalidate("/testimonials", *(f"/testimonials/{obj.id}" for obj in objs), "/portfolio")
+    return objs
+
+
+@router.put("/batch", response_model=List[BulkResult])
+async def update_testimonials(
+    data: List[TestimonialBulkUpdate],
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user),
+):
+    check_batch(data)
+    ids = [item.id for item in data]
+    check_unique(ids)
+    found = await existing(db, Testimonial, ids)
+    results = await update_many(db, Testimonial, [item.dict() for item in data], found)
+    await db.commit()
+    invalidate("/testimonials", *(f"/testimonials/{item_id}" for item_id in found), "/portfolio")
+    return results
+
+
+@router.post("/batch/delete", response_model=List[BulkResult])
+async def delete_testimonials(
+    data: IdList,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user),
+):
+    check_batch(data.ids)
+    check_unique(data.ids)
+    results = await delete_many(db, Testimonial, data.ids)
+    await db.commit()
+    invalidate("/testimonials", *(f"/testimonials/{item_id}" for item_id in data.ids), "/portfolio")
+    return results
+
+
 @router.get("/{item_id}", response_model=TestimonialOut)
-async def get_testimonial(item_id: int, db: AsyncSession = Depends(get_db)):
+async def get_testimonial(item_id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(Testimonial).where(Testimonial.id == item_id))
     obj = result.scalar_one_or_none()
     if obj is None:
@@ -55,6 +118,7 @@ async def update_testimonial(item_id: int, data: TestimonialUpdate, db: AsyncSes
     db.add(obj)
     await db.commit()
     await db.refresh(obj)
+    invalidate("/testimonials", f"/testimonials/{item_id}", "/portfolio")
     return obj
 
 
@@ -66,4 +130,5 @@ async def delete_testimonial(item_id: int, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Testimonial not found")
     await db.delete(obj)
     await db.commit()
+    invalidate("/testimonials", f"/testimonials/{item_id}", "/portfolio")
     return None
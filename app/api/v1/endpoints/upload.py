@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Path
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
 import uuid
-from PIL import Image
 from datetime import datetime
 
 from app.core.config import settings
+from app.core.images import InvalidImage, generate_variants, srcset
+from app.core.media import precompress
+from app.core.storage import StoredUpload, acquire, release, save_content_addressed, save_upload
 from app.core.security import get_current_admin_user
+from app.db.database import get_db
 
 router = APIRouter()
 
@@ -15,9 +19,36 @@ ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp", "svg"}
 def allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def file_url(path: str) -> str:
+    return "/uploads/" + os.path.relpath(path, settings.UPLOAD_DIR).replace(os.sep, "/")
+
+async def store(file: UploadFile, ext: str, subdir: str = "") -> StoredUpload:
+    """Copy the spooled upload to its final location (dated or content-addressed)."""
+    if settings.UPLOAD_CONTENT_ADDRESSED:
+        return await save_content_addressed(file, settings.UPLOAD_DIR, ext, settings.MAX_UPLOAD_SIZE)
+    
+    # Generate unique filename
+    unique_filename = f"{uuid.uuid4().hex}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{ext}"
+    upload_path = os.path.join(settings.UPLOAD_DIR, subdir, datetime.now().strftime("%Y/%m"))
+    file_path = os.path.join(upload_path, unique_filename)
+    
+    # UploadLimitMiddleware has already refused oversized request bodies
+    return await save_upload(file, file_path, settings.MAX_UPLOAD_SIZE)
+
+def upload_response(file: UploadFile, stored: StoredUpload) -> dict:
+    return {
+        "url": file_url(stored.path),
+        "filename": os.path.basename(stored.path),
+        "original_filename": file.filename,
+        "size": stored.size,
+        "sha256": stored.sha256,
+        "content_type": file.content_type
+    }
+
 @router.post("")
 async def upload_file(
     file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_admin_user)
 ):
     if not file.filename:
@@ -29,45 +60,22 @@ async def upload_file(
             detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
-    # Check file size
-    file_content = await file.read()
-    if len(file_content) > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB"
-        )
-    
-    # Generate unique filename
     ext = file.filename.rsplit(".", 1)[1].lower()
-    unique_filename = f"{uuid.uuid4().hex}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{ext}"
-    
-    # Create upload directory structure
-    upload_path = os.path.join(settings.UPLOAD_DIR, datetime.now().strftime("%Y/%m"))
-    os.makedirs(upload_path, exist_ok=True)
-    
-    file_path = os.path.join(upload_path, unique_filename)
-    
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(file_content)
+    stored = await store(file, ext)
+    await precompress(stored.path)
     
-    # Generate URL
-    file_url = f"/uploads/{datetime.now().strftime('%Y/%m')}/{unique_filename}"
-    
-    return {
-        "url": file_url,
-        "filename": unique_filename,
-        "original_filename": file.filename,
-        "size": len(file_content),
-        "content_type": file.content_type
-    }
+    response = upload_response(file, stored)
+    if settings.UPLOAD_CONTENT_ADDRESSED:
+        response["ref_count"] = await acquire(db, stored, settings.UPLOAD_DIR, file.content_type)
+    return response
 
 @router.post("/image")
 async def upload_image(
     file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_admin_user)
 ):
-    """Upload and optionally resize image"""
+    """Upload an image and generate its responsive variants"""
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
     
@@ -77,31 +85,47 @@ async def upload_image(
             detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
-    file_content = await file.read()
-    if len(file_content) > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB"
-        )
-    
     ext = file.filename.rsplit(".", 1)[1].lower()
-    unique_filename = f"{uuid.uuid4().hex}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{ext}"
-    
-    upload_path = os.path.join(settings.UPLOAD_DIR, "images", datetime.now().strftime("%Y/%m"))
-    os.makedirs(upload_path, exist_ok=True)
-    
-    file_path = os.path.join(upload_path, unique_filename)
-    
-    # Save original
-    with open(file_path, "wb") as f:
-        f.write(file_content)
+    stored = await store(file, ext, "images")
+    
+    response = upload_response(file, stored)
+    base_url = response["url"].rsplit("/", 1)[0]
+    
+    # Resized WebP + fallback variants; SVGs scale on their own
+    if stored.path.endswith(".svg"):
+        await precompress(stored.path)
+    else:
+        try:
+            manifest = await generate_variants(stored.path)
+        except InvalidImage:
+            if stored.created:
+                os.remove(stored.path)
+            raise HTTPException(status_code=400, detail="Invalid image file")
+        variants = [
+            {**variant, "url": f"{base_url}/{variant['filename']}"}
+            for variant in manifest["variants"]
+        ]
+        response.update(
+            width=manifest["width"],
+            height=manifest["height"],
+            variants=variants,
+            srcset=srcset(variants, base_url),
+        )
     
-    file_url = f"/uploads/images/{datetime.now().strftime('%Y/%m')}/{unique_filename}"
+    if settings.UPLOAD_CONTENT_ADDRESSED:
+        response["ref_count"] = await acquire(db, stored, settings.UPLOAD_DIR, file.content_type)
+    return response
+
+@router.delete("/{sha256}")
+async def delete_upload(
+    sha256: str = Path(..., pattern="^[0-9a-fA-F]{64}$"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """Release one reference to a content-addressed upload; the file is
+    removed when no references remain"""
+    remaining = await release(db, sha256.lower(), settings.UPLOAD_DIR)
+    if remaining is None:
+        raise HTTPException(status_code=404, detail="File not found")
     
-    return {
-        "url": file_url,
-        "filename": unique_filename,
-        "original_filename": file.filename,
-        "size": len(file_content),
-        "content_type": file.content_type
-    }
+    return {"message": "File deleted" if remaining == 0 else "Reference released", "ref_count": remaining}
@@ -11,6 +11,10 @@ from app.api.v1.endpoints import (
 	upload,
 	testimonials,
 	services,
+	admin,
+	portfolio,
+	search,
+	tags,
 )
 
 api_router = APIRouter()
@@ -25,3 +29,21 @@ api_router.include_router(contact.router, prefix="/contact", tags=["Contact"])
 api_router.include_router(upload.router, prefix="/upload", tags=["Upload"])
 api_router.include_router(testimonials.router, prefix="/testimonials", tags=["Testimonials"])
 api_router.include_router(services.router, prefix="/services", tags=["Services"])
+api_router.include_router(portfolio.router, prefix="/portfolio", tags=["Portfolio"])
+api_router.include_router(search.router, prefix="/search", tags=["Search"])
+api_router.include_router(tags.router, prefix="/tags", tags=["Tags"])
+api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
+
+# Public GET routes served through the response cache (see app.core.cache)
+CACHED_PREFIXES = [
+	"/profile",
+	"/projects",
+	"/posts",
+	"/skills",
+	"/experience",
+	"/testimonials",
+	"/services",
+	"/portfolio",
+	"/search",
+	"/tags",
+]
@@ -0,0 +1,252 @@
+"""Read-through response cache for public GET routes.
+
+Responses are cached as raw bytes keyed on path plus query string. Admin
+write handlers invalidate the paths they affect through `invalidate()`.
+Responses without an ETag get a content-hash one, and conditional
+requests are answered with a 304 straight from the cache.
+The cache is per process; each worker keeps its own copy.
+"""
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from app.core.config import settings
+from app.core.http_cache import content_etag, is_not_modified
+
+CacheKey = Tuple[str, str]
+
+
+class CacheEntry:
+    __slots__ = ("status", "headers", "body", "expires_at", "on_hit")
+
+    def __init__(self, status: int, headers: list, body: bytes, expires_at: float, on_hit=None):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.expires_at = expires_at
+        self.on_hit = on_hit
+
+
+class LRUCache:
+    """In-process LRU cache with a TTL and a bound on the number of entries.
+
+    Any object with the same `get`/`set`/`generation`/`invalidate`/
+    `clear`/`stats` methods can be handed to `ResponseCacheMiddleware`
+    instead.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._by_path: Dict[str, Set[CacheKey]] = {}
+        self._generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._discard(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def generation(self, path: str) -> int:
+        return self._generations.get(path, 0)
+
+    def set(self, key: CacheKey, status: int, headers: list, body: bytes, on_hit=None, generation=None) -> None:
+        # A write invalidated the path while this response was being built
+        if generation is not None and generation != self.generation(key[0]):
+            return
+        if key in self._entries:
+            self._discard(key)
+        self._entries[key] = CacheEntry(status, headers, body, time.monotonic() + self.ttl, on_hit)
+        self._by_path.setdefault(key[0], set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def invalidate(self, *paths: str) -> int:
+        """Drop every cached variant (any query string) of the given paths."""
+        removed = 0
+        for path in paths:
+            self._generations[path] = self._generations.get(path, 0) + 1
+            for key in list(self._by_path.get(path, ())):
+                self._discard(key)
+                removed += 1
+        self.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_path.clear()
+        self._generations.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _discard(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        keys = self._by_path.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_path[key[0]]
+
+
+response_cache = LRUCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=settings.RESPONSE_CACHE_TTL,
+)
+
+_invalidation_listeners: List[Callable[[Iterable[str]], None]] = []
+
+
+def add_invalidation_listener(listener: Callable[[Iterable[str]], None]) -> None:
+    _invalidation_listeners.append(listener)
+
+
+def remove_invalidation_listener(listener: Callable[[Iterable[str]], None]) -> None:
+    if listener in _invalidation_listeners:
+        _invalidation_listeners.remove(listener)
+
+
+def invalidate(*paths: str) -> None:
+    """Invalidate API paths (relative to API_V1_STR) after a write."""
+    full_paths = [f"{settings.API_V1_STR}{path}" for path in paths]
+    response_cache.invalidate(*full_paths)
+    for listener in _invalidation_listeners:
+        listener(full_paths)
+
+
+def on_cache_hit(request, callback: Callable[[], None]) -> None:
+    """Register a side effect to run whenever the cached response is served."""
+    request.state.cache_on_hit = callback
+
+
+def is_internal(scope) -> bool:
+    """Whether the request is an internal render (e.g. a static snapshot).
+
+    Internal renders are not reads: handlers and cache hits skip side
+    effects such as view counting for them.
+    """
+    return bool(scope.get("state", {}).get("internal_render"))
+
+
+class ResponseCacheMiddleware:
+    """Serve and populate `cache` for anonymous GETs under `prefixes`."""
+
+    def __init__(self, app, cache, prefixes: Iterable[str], max_body_size: int = 1024 * 1024):
+        self.app = app
+        self.cache = cache
+        self.prefixes = tuple(prefixes)
+        self.max_body_size = max_body_size
+
+    def _cacheable(self, scope) -> bool:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return False
+        path = scope["path"]
+        if not any(path == p or path.startswith(p + "/") for p in self.prefixes):
+            return False
+        return not any(name == b"authorization" for name, _ in scope["headers"])
+
+    async def __call__(self, scope, receive, send):
+        if not self._cacheable(scope):
+            await self.app(scope, receive, send)
+            return
+
+        query = urlencode(sorted(parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True)))
+        key = (scope["path"], query)
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry.on_hit is not None and not is_internal(scope):
+                entry.on_hit()
+            await self._send(scope, send, entry.status, entry.headers, entry.body, b"HIT")
+            return
+
+        state = scope.setdefault("state", {})
+        generation = self.cache.generation(key[0])
+        captured = {"start": None, "body": []}
+
+        async def buffer_send(message):
+            # JSON bodies are small; buffer them so validators can be added
+            if message["type"] == "http.response.start":
+                captured["start"] = message
+            elif message["type"] == "http.response.body":
+                captured["body"].append(message.get("body", b""))
+
+        await self.app(scope, receive, buffer_send)
+
+        status = captured["start"]["status"]
+        headers = list(captured["start"].get("headers", []))
+        body = b"".join(captured["body"])
+        if status == 200 and _header(headers, b"etag") is None:
+            headers.append((b"etag", content_etag(body).encode("latin-1")))
+        if self._storable(status, headers, body) and not state.get("cache_no_store"):
+            self.cache.set(
+                key,
+                status,
+                headers,
+                body,
+                on_hit=state.get("cache_on_hit"),
+                generation=generation,
+            )
+        await self._send(scope, send, status, headers, body, b"MISS")
+
+    def _storable(self, status: int, headers: list, body: bytes) -> bool:
+        if status != 200 or len(body) > self.max_body_size:
+            return False
+        cache_control = _header(headers, b"cache-control") or b""
+        return b"no-store" not in cache_control and b"private" not in cache_control
+
+    async def _send(self, scope, send, status: int, headers: list, body: bytes, cache_status: bytes) -> None:
+        if status == 200 and self._not_modified(scope, headers):
+            status, body = 304, b""
+            headers = [(k, v) for k, v in headers if k.lower() not in (b"content-length", b"content-type")]
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": headers + [(b"x-cache", cache_status)],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def _not_modified(scope, headers: list) -> bool:
+        request_headers = dict(scope["headers"])
+        etag = _header(headers, b"etag")
+        last_modified = _header(headers, b"last-modified")
+        if_none_match = request_headers.get(b"if-none-match")
+        if_modified_since = request_headers.get(b"if-modified-since")
+        return is_not_modified(
+            if_none_match.decode("latin-1") if if_none_match is not None else None,
+            if_modified_since.decode("latin-1") if if_modified_since is not None else None,
+            etag.decode("latin-1") if etag is not None else None,
+            parsedate_to_datetime(last_modified.decode("latin-1")) if last_modified else None,
+        )
+
+
+def _header(headers: list, name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
@@ -0,0 +1,265 @@
+"""gzip / brotli compression of API responses.
+
+Responses above `COMPRESSION_MIN_SIZE` with a text content type are
+compressed with the best encoding the client accepts (brotli only when the
+optional `brotli` package is installed). Public responses are compressed
+once per (body digest, encoding) and served from an in-process memo
+afterwards, so a hot list is recompressed only when its content changes.
+The memo is keyed on the bytes themselves rather than the ETag, as
+validators need not change with every byte of the body.
+
+The ETag of a compressed response gets an encoding suffix (`"abc-gzip"`),
+as different byte sequences need different validators. The suffix is
+stripped from `If-None-Match` before the request reaches the app, so the
+handlers and the response cache keep comparing against their own ETags.
+"""
+import asyncio
+import gzip
+import hashlib
+import zlib
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.media import accepted_encodings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    b"application/json",
+    b"application/x-ndjson",
+    b"application/javascript",
+    b"image/svg+xml",
+    b"text/",
+)
+# Compress in a worker thread above this size to keep the event loop free
+THREAD_THRESHOLD = 256 * 1024
+
+
+def available_encodings() -> List[str]:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def stream_encoder(encoding: str):
+    """`encode(chunk, more_body) -> bytes`, flushing after every chunk."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=5)
+
+        def encode(body: bytes, more_body: bool) -> bytes:
+            return compressor.process(body) + (compressor.flush() if more_body else compressor.finish())
+    else:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # 31: gzip container
+
+        def encode(body: bytes, more_body: bool) -> bytes:
+            return compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH)
+    return encode
+
+
+def suffix_etag(etag: bytes, encoding: str) -> bytes:
+    if etag.endswith(b'"'):
+        return etag[:-1] + b"-" + encoding.encode() + b'"'
+    return etag
+
+
+def body_digest(body: bytes) -> bytes:
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+class CompressedMemo:
+    """LRU of compressed bodies keyed on (digest of the uncompressed body, encoding)."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[bytes, str], bytes]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: bytes, encoding: str) -> Optional[bytes]:
+        body = self._entries.get((digest, encoding))
+        if body is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((digest, encoding))
+        self.hits += 1
+        return body
+
+    def set(self, digest: bytes, encoding: str, body: bytes) -> None:
+        self._entries[(digest, encoding)] = body
+        self._entries.move_to_end((digest, encoding))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": sum(len(body) for body in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "encodings": available_encodings(),
+        }
+
+
+compressed_memo = CompressedMemo(settings.COMPRESSION_CACHE_MAX_ENTRIES)
+
+
+class CompressionMiddleware:
+    def __init__(self, app, memo: CompressedMemo, minimum_size: int = 1024, exclude_prefixes=()):
+        self.app = app
+        self.memo = memo
+        self.minimum_size = minimum_size
+        self.exclude_prefixes = tuple(exclude_prefixes)
+
+    def _negotiate(self, headers: dict) -> Optional[str]:
+        if b"range" in headers:
+            return None
+        accepted = accepted_encodings(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        for encoding in available_encodings():
+            if accepted.get(encoding, accepted.get("*", 0)) > 0:
+                return encoding
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = dict(scope["headers"])
+        encoding = self._negotiate(request_headers)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Hand the app the validators it issued, without our suffix
+        suffix = b"-" + encoding.encode() + b'"'
+        client_tags = request_headers.get(b"if-none-match")
+        if client_tags is not None and suffix in client_tags:
+            scope = dict(scope)
+            scope["headers"] = [
+                (name, value.replace(suffix, b'"') if name == b"if-none-match" else value)
+                for name, value in scope["headers"]
+            ]
+
+        start = None
+        stream = None  # compressor for bodies sent in several messages
+
+        async def compress_send(message):
+            nonlocal start, stream
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            if stream is None and start is not None and message.get("more_body", False):
+                stream = await self._start_stream(start, encoding, send)
+            if stream is None:
+                await self._finish(start, message.get("body", b""), encoding, client_tags, send)
+                return
+            more_body = message.get("more_body", False)
+            body = stream(message.get("body", b""), more_body)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, compress_send)
+
+    async def _start_stream(self, start, encoding: str, send):
+        """Send the headers of a streaming response; return its chunk encoder."""
+        headers = list(start.get("headers", []))
+        if start["status"] != 200 or not _eligible_type(start) or _header(headers, b"content-encoding"):
+            await send(start)
+            return lambda body, more_body: body
+        headers = [(k, v) for k, v in headers if k.lower() not in (b"content-length", b"etag")]
+        headers.append((b"content-encoding", encoding.encode()))
+        await send({**start, "headers": _add_vary(headers)})
+        return stream_encoder(encoding)
+
+    async def _finish(self, start, body: bytes, encoding: str, client_tags: Optional[bytes], send) -> None:
+        status = start["status"]
+        headers = list(start.get("headers", []))
+
+        if status == 304:
+            # Re-issue the validator the client holds
+            etag = _header(headers, b"etag")
+            if etag is not None and client_tags is not None and suffix_etag(etag, encoding) in client_tags:
+                headers = _replace(headers, b"etag", suffix_etag(etag, encoding))
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        eligible = (
+            status == 200
+            and _eligible_type(start)
+            and _header(headers, b"content-encoding") is None
+        )
+        if not eligible or len(body) < self.minimum_size:
+            if eligible:
+                headers = _add_vary(headers)
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        etag = _header(headers, b"etag")
+        cache_control = _header(headers, b"cache-control") or b""
+        memoizable = (
+            b"public" in cache_control
+            and b"private" not in cache_control
+            and b"no-store" not in cache_control
+        )
+        digest = body_digest(body) if memoizable else None
+        compressed = self.memo.get(digest, encoding) if memoizable else None
+        if compressed is None:
+            if len(body) >= THREAD_THRESHOLD:
+                compressed = await asyncio.to_thread(compress, body, encoding)
+            else:
+                compressed = compress(body, encoding)
+            if memoizable:
+                self.memo.set(digest, encoding, compressed)
+
+        headers = [
+            (name, value) for name, value in headers
+            if name.lower() not in (b"content-length", b"etag")
+        ]
+        headers.append((b"content-encoding", encoding.encode()))
+        headers.append((b"content-length", str(len(compressed)).encode()))
+        if etag is not None:
+            headers.append((b"etag", suffix_etag(etag, encoding)))
+        headers = _add_vary(headers)
+        await send({**start, "headers": headers})
+        await send({"type": "http.response.body", "body": compressed})
+
+
+def _eligible_type(start) -> bool:
+    content_type = _header(start.get("headers", []), b"content-type") or b""
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _header(headers: list, name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _replace(headers: list, name: bytes, value: bytes) -> list:
+    return [(k, value if k.lower() == name else v) for k, v in headers]
+
+
+def _add_vary(headers: list) -> list:
+    vary = _header(headers, b"vary")
+    if vary is None:
+        return headers + [(b"vary", b"Accept-Encoding")]
+    if b"accept-encoding" in vary.lower():
+        return headers
+    return _replace(headers, b"vary", vary + b", Accept-Encoding")
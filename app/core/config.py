@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 import os
 
 class Settings(BaseSettings):
@@ -14,6 +14,19 @@ class Settings(BaseSettings):
     # Database (defaults to SQLite for easy local development)
     DATABASE_URL: str = "sqlite+aiosqlite:///./portfolio.db"
     
+    # Engine runtime profile: "serverless", "long_lived" or "benchmark".
+    # Unset means serverless on Vercel and long_lived everywhere else.
+    DB_PROFILE: Optional[str] = None
+    DB_ECHO: Optional[bool] = None  # overrides the profile's SQL echo
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_CONNECT_TIMEOUT: float = 10.0
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements per connection
+    # Skip create_all at startup when the stored schema fingerprint matches
+    SCHEMA_FINGERPRINT_CHECK: bool = True
+    
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = [
         "http://localhost:3000",
@@ -28,9 +41,60 @@ class Settings(BaseSettings):
     ADMIN_EMAIL: str = "admin@example.com"
     ADMIN_PASSWORD: str = "changeme123"
     
+    # Read replicas for public GET traffic, e.g. '["postgresql+asyncpg://..."]'
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_HEALTH_CHECK_INTERVAL: float = 10.0  # seconds
+    REPLICA_HEALTH_CHECK_TIMEOUT: float = 2.0  # seconds
+    # After a write, reads stay on the primary this long (replication lag)
+    REPLICA_READ_AFTER_WRITE_WINDOW: float = 5.0  # seconds
+    
+    # SQLite performance mode: WAL, tuned pragmas, a single serialized writer
+    # connection and a separate pool of read-only connections
+    SQLITE_PERFORMANCE_MODE: bool = False
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # bytes
+    SQLITE_CACHE_SIZE: int = -64000  # negative = KiB, i.e. 64MB
+    SQLITE_BUSY_TIMEOUT: int = 5000  # ms
+    SQLITE_READ_POOL_SIZE: int = 4
+    
+    # Response cache for public GET routes
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL: float = 300.0  # seconds
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    
+    # gzip/brotli for API responses; compressed bodies are memoized per ETag
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes
+    COMPRESSION_CACHE_MAX_ENTRIES: int = 256
+    
+    # Post view counter (write-behind)
+    VIEW_FLUSH_INTERVAL: float = 5.0  # seconds
+    VIEW_FLUSH_THRESHOLD: int = 500  # flush early once this many views are buffered
+    
+    # Static JSON snapshot; when set, admin writes re-render affected files
+    STATIC_EXPORT_DIR: Optional[str] = None
+    STATIC_EXPORT_DEBOUNCE: float = 1.0  # seconds
+    
+    # Largest batch accepted by the bulk admin endpoints
+    BULK_MAX_ITEMS: int = 500
+    
+    # Verified token -> user cache, entries live until the token's exp
+    AUTH_CACHE_MAX_ENTRIES: int = 1024
+    
+    # bcrypt runs in a thread pool; requests beyond workers + queue get a 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE: int = 16
+    
     # Upload
     UPLOAD_DIR: str = "uploads"
     MAX_UPLOAD_SIZE: int = 5 * 1024 * 1024  # 5MB
+    # Store uploads under cas/<sha256> so identical files are kept once
+    UPLOAD_CONTENT_ADDRESSED: bool = False
+    
+    # Responsive image variants for /upload/image, rendered in a process pool
+    IMAGE_VARIANT_WIDTHS: List[int] = [320, 640, 1024, 1600]
+    IMAGE_FALLBACK_FORMAT: str = "jpeg"  # served to browsers without WebP
+    IMAGE_QUALITY: int = 80
+    IMAGE_WORKERS: int = 2
     
     class Config:
         env_file = ".env"
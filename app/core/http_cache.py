@@ -0,0 +1,108 @@
+"""HTTP validators (ETag / Last-Modified) and Cache-Control policies.
+
+Handlers build a `Validator` from a narrow version query (the table's
+write version from `app.db.versions`) before loading full rows, and call
+`conditional_response()` to answer `If-None-Match` / `If-Modified-Since`
+with a 304.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple, Optional
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.versions import table_version
+
+CACHE_POLICIES = {
+    "detail": "public, max-age=60, stale-while-revalidate=600",
+    "list": "public, max-age=30, stale-while-revalidate=300",
+    "profile": "public, max-age=300, stale-while-revalidate=3600",
+    # Revalidate every time so each read still reaches the view counter
+    "post": "public, no-cache",
+    # Uploaded media: hashed names never change content, others may be replaced
+    "immutable": "public, max-age=31536000, immutable",
+    "media": "public, max-age=3600",
+}
+
+
+class Validator(NamedTuple):
+    etag: str
+    last_modified: Optional[datetime] = None
+
+
+def make_etag(*parts: Any) -> str:
+    return '"' + hashlib.sha256(repr(parts).encode()).hexdigest()[:32] + '"'
+
+
+def content_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def is_not_modified(
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+    etag: Optional[str],
+    last_modified: Optional[datetime],
+) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified) <= _as_utc(since)
+    return False
+
+
+def validator_headers(validator: Validator, cache_control: str) -> dict:
+    headers = {"ETag": validator.etag, "Cache-Control": cache_control}
+    if validator.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(validator.last_modified), usegmt=True)
+    return headers
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    validator: Validator,
+    policy: str,
+) -> Optional[Response]:
+    """Return a 304 if the client's copy is current, else set validators on `response`."""
+    headers = validator_headers(validator, CACHE_POLICIES[policy])
+    if is_not_modified(
+        request.headers.get("if-none-match"),
+        request.headers.get("if-modified-since"),
+        validator.etag,
+        validator.last_modified,
+    ):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+async def collection_validator(db: AsyncSession, request: Request, model) -> Validator:
+    """Validator for any list over `model`'s table, from its write version.
+
+    One primary-key lookup instead of an aggregate over the collection;
+    any write to the table changes the ETag of every list over it.
+    """
+    version = await table_version(db, model)
+    etag = make_etag(
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        version.version if version else None,
+    )
+    return Validator(etag, version.updated_at if version else None)
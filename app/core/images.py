@@ -0,0 +1,123 @@
+"""Responsive image variants for uploaded images.
+
+Resizing and encoding are CPU bound, so they run in a small process pool
+(`IMAGE_WORKERS` processes) rather than on the event loop. The pool reads
+the already saved original from disk and writes each variant next to it
+as `<stem>-<width>w.webp` plus a fallback (`IMAGE_FALLBACK_FORMAT`, or PNG
+for images with transparency).
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Optional
+
+from app.core.config import settings
+
+FORMAT_EXTENSIONS = {"webp": "webp", "jpeg": "jpg", "png": "png"}
+FALLBACK_ALIASES = {"jpg": "jpeg"}
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+class InvalidImage(ValueError):
+    pass
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn: forking a process that already runs database threads is unsafe
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def variant_widths(original_width: int, widths: List[int]) -> List[int]:
+    """Configured widths below the original, never upscaling the largest."""
+    if not widths:
+        return []
+    selected = {w for w in widths if w < original_width}
+    selected.add(min(original_width, max(widths)))
+    return sorted(selected)
+
+
+def render_variants(source_path: str, widths: List[int], fallback_format: str, quality: int) -> dict:
+    """Worker process entry point; returns the manifest with file names."""
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        image = Image.open(source_path)
+        image.load()
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise InvalidImage(str(e))
+
+    manifest = {"width": image.width, "height": image.height, "variants": []}
+    if getattr(image, "is_animated", False):
+        # Re-encoding would drop every frame but the first
+        return manifest
+
+    image = ImageOps.exif_transpose(image)
+    manifest["width"], manifest["height"] = image.size
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    image = image.convert("RGBA" if has_alpha else "RGB")
+    if has_alpha and fallback_format == "jpeg":
+        fallback_format = "png"
+
+    directory = os.path.dirname(source_path)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    for width in variant_widths(image.width, widths):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for fmt in ("webp", fallback_format):
+            name = f"{stem}-{width}w.{FORMAT_EXTENSIONS[fmt]}"
+            options = {"optimize": True} if fmt == "png" else {"quality": quality}
+            if fmt == "jpeg":
+                options.update(optimize=True, progressive=True)
+            path = os.path.join(directory, name)
+            # Content-addressed originals may already have their variants
+            if not os.path.exists(path):
+                resized.save(path, fmt.upper(), **options)
+            manifest["variants"].append(
+                {"width": width, "height": height, "format": fmt, "filename": name}
+            )
+    return manifest
+
+
+async def generate_variants(source_path: str) -> dict:
+    """Render the configured variants of a saved image off the event loop.
+
+    Raises `InvalidImage` when the file cannot be decoded.
+    """
+    fallback = settings.IMAGE_FALLBACK_FORMAT.lower()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(),
+        partial(
+            render_variants,
+            source_path,
+            list(settings.IMAGE_VARIANT_WIDTHS),
+            FALLBACK_ALIASES.get(fallback, fallback),
+            settings.IMAGE_QUALITY,
+        ),
+    )
+
+
+def srcset(variants: List[dict], base_url: str) -> dict:
+    """`{format: "url 320w, url 640w"}` for <picture>/<source> elements."""
+    by_format = {}
+    for variant in variants:
+        by_format.setdefault(variant["format"], []).append(
+            f"{base_url}/{variant['filename']} {variant['width']}w"
+        )
+    return {fmt: ", ".join(entries) for fmt, entries in by_format.items()}
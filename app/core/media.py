@@ -0,0 +1,119 @@
+"""Serving of uploaded media.
+
+`MediaFiles` is the `StaticFiles` app mounted at `/uploads`. On top of
+Starlette's byte ranges, conditional requests and `http.response.pathsend`
+(zero-copy transfer on servers that support it), it:
+
+- marks hashed file names (content-addressed or uuid-named uploads) as
+  immutable, since their URL never points at different bytes;
+- serves a precompressed `<file>.br` / `<file>.gz` sibling when the client
+  accepts that encoding. Siblings are written at upload time by
+  `precompress()`.
+"""
+import asyncio
+import gzip
+import mimetypes
+import os
+import re
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from app.core.http_cache import CACHE_POLICIES
+
+try:
+    import brotli
+except ImportError:  # optional; gzip siblings are always available
+    brotli = None
+
+# Text-based formats worth storing precompressed
+COMPRESSIBLE_EXTENSIONS = {"svg", "json", "txt", "xml", "css", "js"}
+HASHED_NAME = re.compile(r"[0-9a-f]{32,}")
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+
+def is_compressible(path: str) -> bool:
+    return path.rsplit(".", 1)[-1].lower() in COMPRESSIBLE_EXTENSIONS
+
+
+def accepted_encodings(header: Optional[str]) -> Dict[str, float]:
+    accepted = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.lower()] = quality
+    return accepted
+
+
+def _compress_siblings(path: str) -> None:
+    with open(path, "rb") as f:
+        data = f.read()
+    encoded = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded[".br"] = brotli.compress(data, quality=11)
+    for suffix, body in encoded.items():
+        # Keep a sibling only if it actually saves bytes
+        if len(body) < len(data):
+            tmp_path = f"{path}{suffix}.part"
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, path + suffix)
+
+
+async def precompress(path: str) -> None:
+    """Write `.gz` (and `.br` when brotli is installed) next to `path`."""
+    if is_compressible(path):
+        await asyncio.to_thread(_compress_siblings, path)
+
+
+class MediaFiles(StaticFiles):
+    def cache_control(self, path: str) -> str:
+        if HASHED_NAME.search(os.path.basename(path)):
+            return CACHE_POLICIES["immutable"]
+        return CACHE_POLICIES["media"]
+
+    def _precompressed(self, full_path: str, request_headers: Headers):
+        # Ranges address the identity bytes, so serve those as-is
+        if "range" in request_headers:
+            return None
+        accepted = accepted_encodings(request_headers.get("accept-encoding"))
+        for encoding, suffix in ENCODINGS:
+            if accepted.get(encoding, 0) > 0:
+                try:
+                    return encoding, full_path + suffix, os.stat(full_path + suffix)
+                except FileNotFoundError:
+                    continue
+        return None
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = os.fspath(full_path)
+        headers = {"Cache-Control": self.cache_control(full_path)}
+        path, media_type = full_path, None
+
+        if is_compressible(full_path):
+            headers["Vary"] = "Accept-Encoding"
+            sibling = self._precompressed(full_path, request_headers)
+            if sibling is not None:
+                headers["Content-Encoding"], path, stat_result = sibling
+                media_type = mimetypes.guess_type(full_path)[0]
+
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
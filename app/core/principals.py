@@ -0,0 +1,114 @@
+"""Cache of verified access tokens.
+
+`get_current_user` verifies a token's signature and loads its user once;
+later requests with the same token are answered from an in-process LRU
+until the token's `exp`. Entries for a user are dropped after a commit that
+updates or deletes the user row. Core `update(User)` statements bypass the
+ORM events, so call `principal_cache.invalidate_user()` after those.
+"""
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.models.user import User
+
+PRINCIPAL_FIELDS = ("id", "email", "full_name", "is_active", "is_admin", "created_at")
+
+
+def principal_from_user(user: User) -> dict:
+    return {name: getattr(user, name) for name in PRINCIPAL_FIELDS}
+
+
+class PrincipalCache:
+    """LRU of token -> principal, each entry valid until the token expires."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+        self._by_user: Dict[int, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.invalidations = 0
+
+    def get(self, token: str) -> Optional[dict]:
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+        principal, expires_at = entry
+        if expires_at <= time.time():
+            self._remove(token)
+            self.expired += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return principal
+
+    def set(self, token: str, principal: dict, expires_at: float) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[token] = (principal, expires_at)
+        self._entries.move_to_end(token)
+        self._by_user.setdefault(principal["id"], set()).add(token)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, token: str) -> None:
+        principal, _ = self._entries.pop(token)
+        tokens = self._by_user.get(principal["id"])
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._by_user[principal["id"]]
+
+    def invalidate_user(self, user_id: int) -> int:
+        """Drop every cached token of `user_id`; returns how many."""
+        tokens = self._by_user.pop(user_id, set())
+        for token in tokens:
+            self._entries.pop(token, None)
+        self.invalidations += len(tokens)
+        return len(tokens)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_user.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "users": len(self._by_user),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "invalidations": self.invalidations,
+        }
+
+
+principal_cache = PrincipalCache(settings.AUTH_CACHE_MAX_ENTRIES)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _mark_user_changed(mapper, connection, target: User) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_user_ids", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    # After the commit, so a concurrent request can't re-cache the old row
+    for user_id in session.info.pop("changed_user_ids", ()):
+        principal_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_users(session: Session) -> None:
+    session.info.pop("changed_user_ids", None)
@@ -1,22 +1,105 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Union
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# passlib and jose are imported on first use to keep them out of cold starts
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+# bcrypt takes hundreds of milliseconds per call. It runs in a small thread
+# pool (bcrypt releases the GIL) so the event loop keeps serving requests,
+# and calls beyond the pool plus `PASSWORD_HASH_QUEUE` fail fast with 503
+# instead of queueing without bound.
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_pending = 0
+# Guards the counters: hash callbacks run in the worker threads
+_hash_lock = threading.Lock()
+hash_stats = {"completed": 0, "failed": 0, "rejected": 0}
+
+def get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            thread_name_prefix="bcrypt",
+        )
+    return _hash_executor
+
+def shutdown_hash_executor() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=True, cancel_futures=True)
+        _hash_executor = None
+
+def _hash_done(future: Future) -> None:
+    # Runs when the hash has really finished (or was cancelled before it
+    # started), not when the awaiting request gives up on it
+    global _hash_pending
+    with _hash_lock:
+        _hash_pending -= 1
+        if future.cancelled() or future.exception() is not None:
+            hash_stats["failed"] += 1
+        else:
+            hash_stats["completed"] += 1
+
+async def _run_hasher(fn, *args):
+    global _hash_pending
+    with _hash_lock:
+        accepted = _hash_pending < settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE
+        if accepted:
+            _hash_pending += 1
+        else:
+            hash_stats["rejected"] += 1
+    if not accepted:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication requests, try again shortly",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        future = get_hash_executor().submit(fn, *args)
+    except RuntimeError:
+        # Executor shut down
+        with _hash_lock:
+            _hash_pending -= 1
+        raise
+    future.add_done_callback(_hash_done)
+    return await asyncio.wrap_future(future)
+
+def get_hash_stats() -> dict:
+    return {
+        **hash_stats,
+        "pending": _hash_pending,
+        "workers": settings.PASSWORD_HASH_WORKERS,
+        "max_queue": settings.PASSWORD_HASH_QUEUE,
+    }
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hasher(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_hasher(get_password_hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    from jose import jwt
+    
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -27,6 +110,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 def decode_access_token(token: str) -> Optional[dict]:
+    from jose import JWTError, jwt
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
@@ -34,27 +119,42 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 async def get_current_user(token: str = Depends(oauth2_scheme)):
-    from app.db.database import get_db
+    from app.core.principals import principal_cache, principal_from_user
+    from app.db.database import AsyncSessionLocal
     from app.models.user import User
-    from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy import select
     
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    payload = decode_access_token(token)
-    if payload is None:
-        raise credentials_exception
-    
-    email: str = payload.get("sub")
-    if email is None:
-        raise credentials_exception
+    principal = principal_cache.get(token)
+    if principal is None:
+        credentials_exception = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+        
+        payload = decode_access_token(token)
+        if payload is None:
+            raise credentials_exception
+        
+        email: str = payload.get("sub")
+        if email is None:
+            raise credentials_exception
+        
+        # Verified once per token; later requests skip the signature and query
+        condition = User.id == payload["id"] if payload.get("id") is not None else User.email == email
+        async with AsyncSessionLocal() as session:
+            user = (await session.execute(select(User).where(condition))).scalar_one_or_none()
+        if user is None:
+            raise credentials_exception
+        principal = principal_from_user(user)
+        if payload.get("exp") is not None:
+            principal_cache.set(token, principal, float(payload["exp"]))
     
-    return {"email": email, "id": payload.get("id")}
+    if not principal["is_active"]:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
+    return principal
 
 async def get_current_admin_user(current_user: dict = Depends(get_current_user)):
-    # In a real app, check if user is admin
+    if not current_user["is_admin"]:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
     return current_user
@@ -0,0 +1,30 @@
+"""JSON rendering through precompiled pydantic TypeAdapters.
+
+`render()` validates ORM rows straight into the response schema and dumps
+JSON bytes in one pass in pydantic-core, skipping `jsonable_encoder` and
+`json.dumps`. Adapters are built once per type and reused. Routes keep
+their `response_model` for the OpenAPI schema.
+"""
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def adapter(tp: Any) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+def dump_json(tp: Any, payload: Any) -> bytes:
+    type_adapter = adapter(tp)
+    return type_adapter.dump_json(type_adapter.validate_python(payload, from_attributes=True))
+
+
+def render(tp: Any, payload: Any, response: Optional[Response] = None) -> Response:
+    """A JSON response for `payload` as `tp`, keeping headers set on `response`."""
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return Response(content=dump_json(tp, payload), media_type="application/json", headers=headers)
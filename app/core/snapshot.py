@@ -0,0 +1,149 @@
+"""Static JSON snapshots of the public API.
+
+Every public GET response is rendered through the application itself and
+written to `<out_dir><path>.json`, so the files are byte-for-byte what the
+API would return. Additional list pages go to `<out_dir><path>/page/<n>.json`.
+
+`scripts/export_static.py` writes a full snapshot. When `STATIC_EXPORT_DIR`
+is set, the running API also re-renders the paths that admin writes
+invalidate, so the snapshot stays current.
+"""
+import asyncio
+import glob
+import logging
+import os
+import tempfile
+from typing import Iterable, List, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger("uvicorn.error")
+
+# Paginated collections, and the ones whose items get their own documents
+LIST_PATHS = ["/posts", "/projects", "/skills", "/experience", "/testimonials", "/services"]
+SLUG_LISTS = ["/posts", "/projects"]
+SINGLE_PATHS = ["/profile", "/portfolio", "/tags"]
+
+
+class SnapshotWriter:
+    def __init__(self, app, out_dir: str, api_prefix: str = settings.API_V1_STR):
+        self.app = app
+        self.out_dir = out_dir
+        self.api_prefix = api_prefix
+        self._dirty: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _internal_app(self, scope, receive, send):
+        # Marks the render as internal so it isn't counted as a read
+        scope.setdefault("state", {})["internal_render"] = True
+        await self.app(scope, receive, send)
+
+    def _client(self):
+        import httpx
+
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=self._internal_app), base_url="http://snapshot")
+
+    def file_for(self, path: str, page: int = 1) -> str:
+        relative = path.lstrip("/")
+        if page > 1:
+            relative = f"{relative}/page/{page}"
+        return os.path.join(self.out_dir, f"{relative}.json")
+
+    def _write(self, file_path: str, body: bytes) -> None:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, file_path)
+
+    def _remove(self, file_path: str) -> None:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    async def render_document(self, client, path: str) -> bool:
+        response = await client.get(path)
+        file_path = self.file_for(path)
+        if response.status_code == 404:
+            await asyncio.to_thread(self._remove, file_path)
+            return False
+        response.raise_for_status()
+        await asyncio.to_thread(self._write, file_path, response.content)
+        return True
+
+    async def render_list(self, client, path: str) -> List[dict]:
+        """Render every page of a collection and return all items."""
+        items: List[dict] = []
+        page, cursor = 1, None
+        while True:
+            params = {"cursor": cursor} if cursor else {}
+            response = await client.get(path, params=params)
+            response.raise_for_status()
+            await asyncio.to_thread(self._write, self.file_for(path, page), response.content)
+            body = response.json()
+            if isinstance(body, dict):
+                items.extend(body["data"])
+                cursor = body.get("next_cursor")
+            else:
+                items.extend(body)
+                cursor = response.headers.get("x-next-cursor")
+            if not cursor:
+                break
+            page += 1
+        # Drop pages left over from a longer previous snapshot
+        for stale in glob.glob(os.path.join(self.out_dir, path.lstrip("/"), "page", "*.json")):
+            number = os.path.splitext(os.path.basename(stale))[0]
+            if number.isdigit() and int(number) > page:
+                await asyncio.to_thread(self._remove, stale)
+        return items
+
+    async def export_all(self) -> int:
+        """Render the full public API. Returns the number of documents written."""
+        written = 0
+        async with self._client() as client:
+            for path in SINGLE_PATHS:
+                written += await self.render_document(client, self.api_prefix + path)
+            for path in LIST_PATHS:
+                items = await self.render_list(client, self.api_prefix + path)
+                written += 1
+                if path in SLUG_LISTS:
+                    slugs = {item["slug"] for item in items}
+                    for slug in slugs:
+                        written += await self.render_document(
+                            client, f"{self.api_prefix}{path}/{slug}"
+                        )
+                    # Remove documents for items that are gone or unpublished
+                    pattern = os.path.join(self.out_dir, self.api_prefix.lstrip("/"), path.lstrip("/"), "*.json")
+                    for existing in glob.glob(pattern):
+                        if os.path.splitext(os.path.basename(existing))[0] not in slugs:
+                            await asyncio.to_thread(self._remove, existing)
+        return written
+
+    async def refresh(self, paths: Iterable[str]) -> None:
+        """Re-render only the given (invalidated) API paths."""
+        lists = {self.api_prefix + path for path in LIST_PATHS}
+        singles = {self.api_prefix + path for path in SINGLE_PATHS}
+        slug_prefixes = tuple(f"{self.api_prefix}{path}/" for path in SLUG_LISTS)
+        async with self._client() as client:
+            for path in sorted(set(paths)):
+                if path in lists:
+                    await self.render_list(client, path)
+                elif path in singles or path.startswith(slug_prefixes):
+                    await self.render_document(client, path)
+
+    def mark_dirty(self, paths: Iterable[str]) -> None:
+        """Invalidation listener: batch dirty paths and refresh them shortly after."""
+        self._dirty.update(paths)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._flush_dirty())
+
+    async def _flush_dirty(self) -> None:
+        while self._dirty:
+            # Let the write request finish and coalesce bursts of admin edits
+            await asyncio.sleep(settings.STATIC_EXPORT_DEBOUNCE)
+            paths, self._dirty = self._dirty, set()
+            try:
+                await self.refresh(paths)
+            except Exception:
+                logger.exception("Failed to refresh static snapshot for %s", sorted(paths))
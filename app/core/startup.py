@@ -0,0 +1,37 @@
+"""Cold-start timing, broken down by phase.
+
+`startup_timer` is created when `main` is first imported; `lifespan` marks
+the end of each phase and the report is logged once startup finishes and
+served at `GET /api/admin/startup`.
+"""
+import logging
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class StartupTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: Dict[str, float] = {}
+        self.schema: Optional[str] = None
+        self.total_ms: Optional[float] = None
+
+    def mark(self, phase: str) -> None:
+        """End `phase`, timed from the previous mark."""
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last) * 1000, 2)
+        self._last = now
+
+    def finish(self) -> None:
+        self.total_ms = round((time.perf_counter() - self.started) * 1000, 2)
+        phases = ", ".join(f"{name} {ms:.0f}ms" for name, ms in self.phases.items())
+        logger.info("Cold start in %.0fms (schema %s): %s", self.total_ms, self.schema, phases)
+
+    def report(self) -> dict:
+        return {"total_ms": self.total_ms, "schema": self.schema, "phases_ms": dict(self.phases)}
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,211 @@
+"""Streaming writes of uploaded files.
+
+Starlette's multipart parser spools the whole request body to a temporary
+file before the endpoint runs, so `UploadLimitMiddleware` enforces the size
+limit on the raw request stream: a declared Content-Length over the limit is
+refused before any of the body is read, and a body without one is cut off at
+the chunk that crosses it.
+
+The spooled upload is then copied in fixed-size chunks to a temporary file
+in the target directory with async file I/O, hashed as it goes, and renamed
+into place only once complete, so a partially written file is never visible
+under its final name.
+
+With `UPLOAD_CONTENT_ADDRESSED`, files are stored as
+`cas/<ab>/<cd>/<sha256>.<ext>`: identical uploads share one file, the URL
+never changes meaning, and a `StoredFile` row counts the uploads that refer
+to it so the file is only removed when the last one is deleted.
+"""
+import glob
+import hashlib
+import os
+import uuid
+from typing import NamedTuple, Optional, Tuple
+
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.stored_file import StoredFile
+
+CHUNK_SIZE = 1024 * 1024
+CAS_DIR = "cas"
+FORM_OVERHEAD = 64 * 1024  # multipart boundaries and part headers around the file
+
+
+class StoredUpload(NamedTuple):
+    path: str
+    size: int
+    sha256: str
+    created: bool = True  # False when identical content was already stored
+
+
+def too_large(max_size: int) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail=f"File too large. Maximum size: {max_size / 1024 / 1024}MB"
+    )
+
+
+class UploadLimitMiddleware:
+    """Refuse request bodies on `prefixes` larger than `max_size` plus form overhead."""
+
+    def __init__(self, app, prefixes, max_size: int):
+        self.app = app
+        self.prefixes = tuple(prefixes)
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.max_size + FORM_OVERHEAD
+        declared = dict(scope["headers"]).get(b"content-length", b"")
+        oversized = declared.isdigit() and int(declared) > limit
+        received = 0
+
+        # Raised inside the app, so FastAPI turns it into the usual 400
+        async def limited_receive():
+            nonlocal received
+            if oversized:
+                raise too_large(self.max_size)
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise too_large(self.max_size)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+async def _remove(path: str) -> None:
+    try:
+        await aiofiles.os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def _stream_to_temp(file: UploadFile, directory: str, max_size: int) -> Tuple[str, int, str]:
+    await aiofiles.os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f".{uuid.uuid4().hex}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(tmp_path, "wb") as out:
+            while chunk := await file.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise too_large(max_size)
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        await _remove(tmp_path)
+        raise
+    return tmp_path, size, digest.hexdigest()
+
+
+async def save_upload(file: UploadFile, path: str, max_size: int) -> StoredUpload:
+    """Copy `file` to `path`, raising a 400 if it exceeds `max_size` bytes."""
+    tmp_path, size, sha256 = await _stream_to_temp(file, os.path.dirname(path), max_size)
+    try:
+        await aiofiles.os.replace(tmp_path, path)
+    except BaseException:
+        await _remove(tmp_path)
+        raise
+    return StoredUpload(path=path, size=size, sha256=sha256)
+
+
+def cas_path(root: str, sha256: str, ext: str) -> str:
+    return os.path.join(root, CAS_DIR, sha256[:2], sha256[2:4], f"{sha256}.{ext}")
+
+
+def _find_original(root: str, sha256: str) -> Optional[str]:
+    # Skip derived files such as `<sha>.svg.gz` and `<sha>-640w.webp`
+    for path in glob.glob(cas_path(root, sha256, "*")):
+        if os.path.basename(path).count(".") == 1:
+            return path
+    return None
+
+
+async def save_content_addressed(file: UploadFile, root: str, ext: str, max_size: int) -> StoredUpload:
+    """Stream `file` into the content-addressed store under `root`.
+
+    When the same bytes are already stored the new copy is discarded and
+    the existing path is returned with `created=False`.
+    """
+    tmp_path, size, sha256 = await _stream_to_temp(file, os.path.join(root, CAS_DIR), max_size)
+    existing = _find_original(root, sha256)
+    if existing:
+        await _remove(tmp_path)
+        return StoredUpload(path=existing, size=size, sha256=sha256, created=False)
+
+    path = cas_path(root, sha256, ext)
+    try:
+        await aiofiles.os.makedirs(os.path.dirname(path), exist_ok=True)
+        await aiofiles.os.replace(tmp_path, path)
+    except BaseException:
+        await _remove(tmp_path)
+        raise
+    return StoredUpload(path=path, size=size, sha256=sha256)
+
+
+async def acquire(db: AsyncSession, stored: StoredUpload, root: str, content_type: Optional[str]) -> int:
+    """Count one more reference to a content-addressed file. Returns the new count."""
+    increment = (
+        update(StoredFile)
+        .where(StoredFile.sha256 == stored.sha256)
+        .values(ref_count=StoredFile.ref_count + 1)
+        .returning(StoredFile.ref_count)
+    )
+    ref_count = (await db.execute(increment)).scalar_one_or_none()
+    if ref_count is not None:
+        await db.commit()
+        return ref_count
+    try:
+        db.add(StoredFile(
+            sha256=stored.sha256,
+            path=os.path.relpath(stored.path, root),
+            size=stored.size,
+            content_type=content_type,
+            ref_count=1,
+        ))
+        await db.commit()
+        return 1
+    except IntegrityError:
+        # A concurrent upload of the same bytes inserted the row first
+        await db.rollback()
+        ref_count = (await db.execute(increment)).scalar_one()
+        await db.commit()
+        return ref_count
+
+
+async def release(db: AsyncSession, sha256: str, root: str) -> Optional[int]:
+    """Drop one reference; removes the file and its derived files at zero.
+
+    Returns the remaining count, or None when no such file is stored.
+    """
+    remaining = (await db.execute(
+        update(StoredFile)
+        .where(StoredFile.sha256 == sha256)
+        .values(ref_count=StoredFile.ref_count - 1)
+        .returning(StoredFile.ref_count)
+    )).scalar_one_or_none()
+    if remaining is None:
+        return None
+    if remaining <= 0:
+        await db.execute(
+            delete(StoredFile).where(StoredFile.sha256 == sha256, StoredFile.ref_count <= 0)
+        )
+    await db.commit()
+
+    if remaining <= 0:
+        # The original plus its image variants and precompressed siblings
+        stem = os.path.join(root, CAS_DIR, sha256[:2], sha256[2:4], sha256)
+        for path in glob.glob(f"{stem}.*") + glob.glob(f"{stem}-*"):
+            await _remove(path)
+    return max(remaining, 0)
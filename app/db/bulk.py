@@ -0,0 +1,80 @@
+"""Batch writes for the admin endpoints.
+
+Each helper issues a fixed number of statements whatever the batch size:
+executemany INSERT ... RETURNING, executemany UPDATE by primary key,
+DELETE ... WHERE id IN and one `UPDATE ... SET order = CASE id ...` for
+reordering. Callers run them in their session's transaction and commit.
+"""
+from typing import Any, Dict, List, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import case, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+def check_batch(items: Sequence[Any]) -> None:
+    if not items:
+        raise HTTPException(status_code=400, detail="Empty batch")
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {settings.BULK_MAX_ITEMS} items per batch")
+
+
+def check_unique(ids: Sequence[int]) -> None:
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Duplicate ids in batch")
+
+
+async def insert_many(db: AsyncSession, model, rows: List[Dict[str, Any]]) -> list:
+    """Insert `rows` and return the new objects in input order."""
+    result = await db.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows)
+    return list(result.all())
+
+
+async def existing(db: AsyncSession, model, ids: Sequence[int], *columns) -> dict:
+    """`{id: row}` for the ids that exist, with `columns` loaded."""
+    result = await db.execute(select(model.id, *columns).where(model.id.in_(ids)))
+    return {row.id: row for row in result}
+
+
+async def update_many(db: AsyncSession, model, rows: List[Dict[str, Any]], found) -> List[dict]:
+    """Update rows by primary key; each row is `{"id": ..., column: value}`.
+
+    `found` holds the ids known to exist; the others are reported as
+    `not_found` and skipped.
+    """
+    changes = [row for row in rows if row["id"] in found and len(row) > 1]
+    if changes:
+        await db.execute(update(model), changes)
+    return [
+        {"id": row["id"], "status": "updated" if row["id"] in found else "not_found"}
+        for row in rows
+    ]
+
+
+async def delete_many(db: AsyncSession, model, ids: Sequence[int]) -> List[dict]:
+    result = await db.execute(
+        delete(model).where(model.id.in_(ids)).returning(model.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = set(result.scalars().all())
+    return [{"id": id, "status": "deleted" if id in deleted else "not_found"} for id in ids]
+
+
+async def reorder(db: AsyncSession, model, ids: Sequence[int]) -> List[dict]:
+    """Set `order` to each id's position in `ids` in a single UPDATE."""
+    positions = {id: position for position, id in enumerate(ids)}
+    result = await db.execute(
+        update(model)
+        .where(model.id.in_(ids))
+        .values({model.order: case(positions, value=model.id)})
+        .returning(model.id)
+        .execution_options(synchronize_session=False)
+    )
+    updated = set(result.scalars().all())
+    return [
+        {"id": id, "order": positions[id], "status": "updated"} if id in updated
+        else {"id": id, "order": None, "status": "not_found"}
+        for id in ids
+    ]
@@ -0,0 +1,193 @@
+"""NDJSON export and import of all CMS content.
+
+The stream starts with a header line, followed by one line per row:
+
+    {"format": "portfolio-content", "version": 1, "exported_at": "..."}
+    {"table": "posts", "row": {"id": 1, "slug": "hello", ...}}
+
+Export reads each table through a server-side cursor (`yield_per`) so
+memory stays flat whatever the table size. Users, uploads bookkeeping and
+the derived search/tag indexes are left out; the indexes are rebuilt after
+an import. Import upserts in batches: tables with a `slug` match rows by
+slug (ids are reassigned), the rest match by id.
+"""
+import json
+from datetime import date, datetime
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import Date, DateTime, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+
+# versions: imported upserts bump the table versions behind HTTP validators
+from app.db import search, tags, versions  # noqa: F401
+from app.models.contact import Contact
+from app.models.experience import Experience
+from app.models.post import Post
+from app.models.profile import Profile
+from app.models.project import Project
+from app.models.service import Service
+from app.models.skill import Skill
+from app.models.testimonial import Testimonial
+
+FORMAT = "portfolio-content"
+VERSION = 1
+EXPORT_MODELS = [Profile, Project, Post, Skill, Experience, Testimonial, Service, Contact]
+TABLES = {model.__tablename__: model.__table__ for model in EXPORT_MODELS}
+INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+class InvalidImport(ValueError):
+    pass
+
+
+def _encode(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _line(payload: dict) -> bytes:
+    return json.dumps(payload, default=_encode, separators=(",", ":")).encode() + b"\n"
+
+
+async def export_lines(conn, batch_size: int = 500) -> AsyncIterator[bytes]:
+    """Yield the export a batch of rows at a time."""
+    yield _line({"format": FORMAT, "version": VERSION, "exported_at": datetime.utcnow().isoformat()})
+    for name, table in TABLES.items():
+        result = await conn.stream(
+            select(table).order_by(table.c.id).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.mappings().partitions():
+            yield b"".join(_line({"table": name, "row": dict(row)}) for row in partition)
+
+
+async def export_stream(engine, batch_size: int = 500) -> AsyncIterator[bytes]:
+    """Export on a dedicated connection, in one snapshot of the database."""
+    async with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execution_options(isolation_level="REPEATABLE READ")
+        async for chunk in export_lines(conn, batch_size):
+            yield chunk
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines without reading it all first."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+def _decode_row(table, row: dict) -> dict:
+    decoded = {}
+    for key, value in row.items():
+        column = table.c.get(key)
+        if column is None:
+            continue  # written by a newer schema; ignore
+        if isinstance(value, str) and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        elif isinstance(value, str) and isinstance(column.type, Date):
+            value = date.fromisoformat(value)
+        decoded[key] = value
+    if "slug" in table.c:
+        decoded.pop("id", None)
+    return decoded
+
+
+class Importer:
+    """Buffers rows per table and flushes them as batched upserts."""
+
+    def __init__(self, db, batch_size: int = 500):
+        self.db = db
+        self.batch_size = batch_size
+        self.insert = INSERTS.get(db.get_bind().dialect.name)
+        if self.insert is None:
+            raise InvalidImport(f"Import is not supported on {db.get_bind().dialect.name}")
+        self.pending: Dict[str, List[dict]] = {}
+        self.counts: Dict[str, int] = {}
+
+    async def add(self, name: str, row: dict) -> None:
+        table = TABLES.get(name)
+        if table is None:
+            raise InvalidImport(f"Unknown table {name!r}")
+        rows = self.pending.setdefault(name, [])
+        rows.append(_decode_row(table, row))
+        if len(rows) >= self.batch_size:
+            await self.flush(name)
+
+    async def flush(self, name: str) -> None:
+        rows = self.pending.pop(name, [])
+        table = TABLES[name]
+        key = "slug" if "slug" in table.c else "id"
+        # executemany needs one column set per statement
+        groups: Dict[Tuple[str, ...], List[dict]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        for columns, group in groups.items():
+            statement = self.insert(table)
+            updates = {column: statement.excluded[column] for column in columns if column not in ("id", key)}
+            if updates:
+                statement = statement.on_conflict_do_update(index_elements=[key], set_=updates)
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=[key])
+            await self.db.execute(statement, group)
+        self.counts[name] = self.counts.get(name, 0) + len(rows)
+
+    async def finish(self) -> Dict[str, int]:
+        for name in list(self.pending):
+            await self.flush(name)
+        if self.insert is postgresql.insert:
+            # Explicit ids bypass the sequences; move them past the imported rows
+            for name in self.counts:
+                if "slug" not in TABLES[name].c:
+                    await self.db.execute(text(
+                        f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), "
+                        f"GREATEST((SELECT MAX(id) FROM {name}), 1))"
+                    ))
+        return self.counts
+
+
+async def import_lines(db, lines: AsyncIterable[bytes], batch_size: int = 500) -> Dict[str, int]:
+    """Upsert an export into `db`, rebuild the indexes and commit.
+
+    Returns the row count per table. Nothing is committed if a line is
+    invalid.
+    """
+    importer = Importer(db, batch_size)
+    header: Optional[dict] = None
+    number = 0
+    try:
+        async for line in lines:
+            number += 1
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except ValueError:
+                raise InvalidImport(f"Line {number}: invalid JSON")
+            if header is None:
+                if payload.get("format") != FORMAT or payload.get("version") != VERSION:
+                    raise InvalidImport(f"Line {number}: not a {FORMAT} v{VERSION} export")
+                header = payload
+                continue
+            if not isinstance(payload.get("row"), dict):
+                raise InvalidImport(f"Line {number}: expected {{\"table\": ..., \"row\": {{...}}}}")
+            await importer.add(payload.get("table"), payload["row"])
+        if header is None:
+            raise InvalidImport("Empty import")
+        counts = await importer.finish()
+        await search.rebuild(db)
+        await tags.rebuild(db)
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise InvalidImport(f"Rejected by the database: {e.orig}")
+    except Exception:
+        await db.rollback()
+        raise
+    return counts
@@ -1,17 +1,126 @@
+import os
+from urllib.parse import urlsplit
+
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
+from app.db.replicas import Replica, ReplicaRouter
+
+# Runtime profiles for the engine. `long_lived` takes its pool sizing from
+# Settings so it can be tuned per deployment without a code change.
+ENGINE_PROFILES = {
+    # One connection per invocation: nothing survives between cold starts
+    "serverless": {
+        "poolclass": NullPool,
+        "echo": False,
+        "connect_timeout": 3,
+        "statement_cache_size": 0,
+    },
+    "long_lived": {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": True,
+        "echo": False,
+        "connect_timeout": settings.DB_CONNECT_TIMEOUT,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
+    # Large fixed pool, no per-checkout ping, no logging
+    "benchmark": {
+        "pool_size": 20,
+        "max_overflow": 0,
+        "pool_pre_ping": False,
+        "echo": False,
+        "connect_timeout": settings.DB_CONNECT_TIMEOUT,
+        "statement_cache_size": 500,
+    },
+}
+
+def resolve_profile() -> str:
+    if settings.DB_PROFILE:
+        return settings.DB_PROFILE
+    return "serverless" if os.environ.get("VERCEL") else "long_lived"
+
+def engine_options(url: str, profile: str) -> dict:
+    """Translate a profile into create_async_engine() keyword arguments."""
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown DB_PROFILE {profile!r}; expected one of {', '.join(ENGINE_PROFILES)}")
+    options = dict(ENGINE_PROFILES[profile])
+    connect_timeout = options.pop("connect_timeout")
+    statement_cache_size = options.pop("statement_cache_size")
+    if settings.DB_ECHO is not None:
+        options["echo"] = settings.DB_ECHO
+
+    connect_args = {}
+    if url.startswith("sqlite"):
+        connect_args["check_same_thread"] = False
+        if ":memory:" in url or url.rstrip("/").endswith(":"):
+            # In-memory databases keep SQLAlchemy's default single-connection pool
+            for key in ("poolclass", "pool_size", "max_overflow", "pool_timeout", "pool_recycle"):
+                options.pop(key, None)
+    elif "+asyncpg" in url:
+        connect_args["timeout"] = connect_timeout
+        connect_args["prepared_statement_cache_size"] = statement_cache_size
+
+    options["connect_args"] = connect_args
+    return options
+
+def is_sqlite_file(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url and not url.rstrip("/").endswith(":")
 
-# Configure engine based on database type
-connect_args = {}
-if settings.DATABASE_URL.startswith("sqlite"):
-    connect_args["check_same_thread"] = False
+def _sqlite_pragmas(read_only: bool):
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=True,
-    future=True,
-    connect_args=connect_args,
+    def apply(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return apply
+
+def create_engines(url: str, profile: str, sqlite_tuned: bool = False):
+    """Return `(write_engine, read_engine)`; they are the same engine unless
+    SQLite performance mode splits them."""
+    options = engine_options(url, profile)
+    if not (sqlite_tuned and is_sqlite_file(url)):
+        write_engine = create_async_engine(url, future=True, **options)
+        return write_engine, write_engine
+
+    # SQLite allows one writer at a time: route all writes through a single
+    # pooled connection (callers queue on checkout) and serve reads from a
+    # separate pool of query-only connections, which WAL lets run alongside.
+    options.pop("poolclass", None)
+    options.pop("pool_pre_ping", None)
+    write_engine = create_async_engine(
+        url, future=True, **{**options, "pool_size": 1, "max_overflow": 0}
+    )
+    read_engine = create_async_engine(
+        url,
+        future=True,
+        **{**options, "pool_size": settings.SQLITE_READ_POOL_SIZE, "max_overflow": 0},
+    )
+    event.listen(write_engine.sync_engine, "connect", _sqlite_pragmas(read_only=False))
+    event.listen(read_engine.sync_engine, "connect", _sqlite_pragmas(read_only=True))
+    return write_engine, read_engine
+
+DB_PROFILE = resolve_profile()
+
+engine, read_engine = create_engines(
+    settings.DATABASE_URL, DB_PROFILE, settings.SQLITE_PERFORMANCE_MODE
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -22,8 +131,71 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+# Read replicas for anonymous GET traffic; an empty list keeps reads on the primary
+replica_router = ReplicaRouter(
+    [
+        Replica(
+            urlsplit(url).hostname or f"replica-{i}",
+            create_async_engine(url, future=True, **engine_options(url, DB_PROFILE)),
+        )
+        for i, url in enumerate(settings.DATABASE_REPLICA_URLS)
+    ],
+    check_interval=settings.REPLICA_HEALTH_CHECK_INTERVAL,
+    check_timeout=settings.REPLICA_HEALTH_CHECK_TIMEOUT,
+    write_window=settings.REPLICA_READ_AFTER_WRITE_WINDOW,
+)
+
 Base = declarative_base()
 
+def pool_stats(target=None) -> dict:
+    """Pool statistics for the admin endpoint."""
+    pool = (target or engine).pool
+    stats = {
+        "profile": DB_PROFILE,
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+    }
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    return stats
+
+async def get_read_db(request: Request) -> AsyncSession:
+    """Session for read-only handlers; never commits.
+
+    Anonymous reads are spread across healthy replicas. Authenticated
+    requests (the admin UI), internal snapshot renders and reads shortly
+    after a write stay on the primary so they see the latest writes. A
+    replica that fails mid-request is marked down and the request carries
+    on against the primary.
+    """
+    from app.core.cache import is_internal  # app.core.cache imports the models
+
+    replica = None
+    if "authorization" not in request.headers and not is_internal(request.scope):
+        replica = replica_router.pick()
+    if replica is None:
+        async with ReadSessionLocal() as session:
+            yield session
+        return
+
+    async with replica.sessionmaker() as session:
+        session.fallback = read_engine
+        session.on_failover = lambda: replica_router.mark_down(replica)
+        yield session
+    if replica_router.pinned():
+        # A write landed while this read ran; the replica may not have it yet
+        request.state.cache_no_store = True
+
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
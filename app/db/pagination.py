@@ -0,0 +1,171 @@
+"""Keyset pagination shared by the list endpoints.
+
+Cursors are opaque tokens holding the sort-key values of the last row of
+the previous page. The next page is selected with a keyset predicate on
+those values, so deep pages cost the same as the first one and a cursor
+stays valid when its row is deleted.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query
+from sqlalchemy import Date, DateTime, String, and_, false, func, literal, or_, select, text, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+SortKey = Tuple[Any, bool]  # (column or expression, descending)
+
+
+class PageParams:
+    """Common query parameters for paginated list endpoints."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="Opaque token from a previous page's next_cursor"),
+        skip: int = Query(0, ge=0, description="Offset, ignored when a cursor is given"),
+        limit: int = Query(100, ge=1, le=100),
+        count: str = Query("exact", pattern="^(exact|estimated|none)$"),
+    ):
+        self.cursor = cursor
+        self.skip = skip
+        self.limit = limit
+        self.count = count
+
+
+def encode_token(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_token(token: str) -> dict:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return payload
+
+
+def _stored_as_text(key, dialect: str) -> bool:
+    # SQLite keeps CURRENT_TIMESTAMP defaults without a fraction and values
+    # written by SQLAlchemy with six digits; both spellings sort as text
+    return dialect == "sqlite" and isinstance(key.type, (Date, DateTime))
+
+
+def _cursor_columns(sort_keys: Sequence[SortKey], dialect: str) -> list:
+    """The sort-key values, selected next to each row for the next cursor."""
+    columns = []
+    for i, (key, _) in enumerate(sort_keys):
+        if _stored_as_text(key, dialect):
+            key = type_coerce(key, String)
+        columns.append(key.label(f"_cursor_{i}"))
+    return columns
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    values = [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values]
+    return encode_token({"k": values})
+
+
+def decode_cursor(cursor: str, sort_keys: Sequence[SortKey], dialect: str) -> List[Any]:
+    values = decode_token(cursor).get("k")
+    if not isinstance(values, list) or len(values) != len(sort_keys):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    try:
+        for i, (key, _) in enumerate(sort_keys):
+            if values[i] is None:
+                continue
+            if _stored_as_text(key, dialect):
+                values[i] = literal(str(values[i]), String)
+            elif isinstance(key.type, DateTime):
+                values[i] = datetime.fromisoformat(values[i])
+            elif isinstance(key.type, Date):
+                values[i] = date.fromisoformat(values[i])
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def _after_cursor(sort_keys: Sequence[SortKey], values: Sequence[Any], dialect: str):
+    """Build `(k1, k2, ...) > cursor` for mixed sort directions."""
+    clauses = []
+    equal_prefix = []
+    for (key, descending), value in zip(sort_keys, values):
+        if value is None:
+            # Rows after a NULL are the non-NULL ones only where NULLs sort first
+            nulls_first = descending == (dialect == "postgresql")
+            clauses.append(and_(*equal_prefix, key.is_not(None) if nulls_first else false()))
+            equal_prefix.append(key.is_(None))
+        else:
+            clauses.append(and_(*equal_prefix, key < value if descending else key > value))
+            equal_prefix.append(key == value)
+    return or_(*clauses)
+
+
+async def _estimate_count(db: AsyncSession, query) -> Optional[int]:
+    # Planner estimates are only available on Postgres; other dialects fall back to COUNT(*)
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql":
+        return None
+    sql = query.order_by(None).compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    plan = (await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(db: AsyncSession, query, mode: str = "exact") -> Optional[int]:
+    if mode == "none":
+        return None
+    if mode == "estimated":
+        estimate = await _estimate_count(db, query)
+        if estimate is not None:
+            return estimate
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return await db.scalar(count_query)
+
+
+async def paginate(
+    db: AsyncSession,
+    query,
+    model,
+    sort_keys: Sequence[SortKey],
+    page: PageParams,
+) -> dict:
+    """Run `query` for one page and return `{"data", "total", "next_cursor"}`.
+
+    `sort_keys` must end with a unique column (normally `model.id`) so that
+    the keyset is a total order.
+    """
+    dialect = db.get_bind().dialect.name
+    total = await count_rows(db, query, page.count)
+
+    if page.cursor:
+        query = query.where(_after_cursor(sort_keys, decode_cursor(page.cursor, sort_keys, dialect), dialect))
+    elif page.skip:
+        query = query.offset(page.skip)
+
+    # ORM entities for `select(Model)`; plain mappings for column projections
+    columns = query.column_descriptions
+    entities = len(columns) == 1 and columns[0]["expr"] is model
+
+    order_by = [key.desc() if descending else key.asc() for key, descending in sort_keys]
+    query = query.add_columns(*_cursor_columns(sort_keys, dialect))
+    query = query.order_by(*order_by).limit(page.limit + 1)
+
+    rows = (await db.execute(query)).all()
+    width = len(columns)
+    if entities:
+        items = [row[0] for row in rows]
+    else:
+        items = [dict(zip(row._fields[:width], row)) for row in rows]
+
+    next_cursor = None
+    if len(items) > page.limit:
+        items = items[:page.limit]
+        next_cursor = encode_cursor(rows[page.limit - 1][width:])
+
+    return {"data": items, "total": total, "next_cursor": next_cursor}
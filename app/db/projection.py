@@ -0,0 +1,44 @@
+"""Column projections for list endpoints (`view=` / `fields=`).
+
+List pages select only the columns the response schema needs, so large
+Text columns such as `content` are never read for a summary page. Rows come
+back as mappings and are rendered with the matching schema.
+"""
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Tuple, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ConfigDict, create_model
+
+
+class Projection(NamedTuple):
+    columns: List[Any]
+    schema: Type[BaseModel]
+
+
+@lru_cache(maxsize=256)
+def partial_schema(schema: Type[BaseModel], names: Tuple[str, ...]) -> Type[BaseModel]:
+    """`schema` restricted to `names`, built once per field set."""
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in names},
+    )
+
+
+def project_columns(model, schema: Type[BaseModel], fields: Optional[str] = None) -> Projection:
+    """Columns of `model` to select for `schema`, optionally narrowed by `fields`.
+
+    `fields` is a comma-separated subset of the schema's fields. `id` is
+    always included so clients can address each item; the page cursor does
+    not need it, since `paginate` selects its own sort-key columns.
+    """
+    names = list(schema.model_fields)
+    if fields:
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested.difference(names)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        names = [name for name in names if name in requested or name == "id"]
+        schema = partial_schema(schema, tuple(names))
+    return Projection([getattr(model, name) for name in names], schema)
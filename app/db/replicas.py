@@ -0,0 +1,159 @@
+"""Round-robin routing of read-only sessions across database replicas.
+
+A replica that fails a health check or a query is taken out of rotation
+until a later health check succeeds. With no healthy replica left, reads
+fall back to the primary, as they do for a short window after each write
+so that clients read their own writes despite replication lag.
+"""
+import asyncio
+import itertools
+import logging
+import time
+from typing import Callable, Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class ReplicaSession(AsyncSession):
+    """Read-only session on a replica that moves to `fallback` (the primary)
+    when the replica fails mid-request. Reads are safe to run again."""
+
+    fallback: Optional[AsyncEngine] = None
+    on_failover: Optional[Callable[[], None]] = None
+
+    def _replica_failed(self, error: Exception) -> bool:
+        if isinstance(error, (OperationalError, InterfaceError, OSError)):
+            return True
+        return isinstance(error, DBAPIError) and error.connection_invalidated
+
+    async def _run(self, method, *args, **kwargs):
+        try:
+            return await method(*args, **kwargs)
+        except Exception as e:
+            if self.fallback is None or not self._replica_failed(e):
+                raise
+            if self.on_failover is not None:
+                self.on_failover()
+            await self.rollback()
+            self.bind = self.fallback
+            self.sync_session.bind = self.fallback.sync_engine
+            self.fallback = None
+            return await method(*args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        return await self._run(super().execute, *args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return await self._run(super().scalar, *args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        return await self._run(super().scalars, *args, **kwargs)
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.sessionmaker = async_sessionmaker(
+            engine,
+            class_=ReplicaSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+        self.healthy = True
+        self.down_since: Optional[float] = None
+        self.failures = 0
+
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        replicas: List[Replica],
+        check_interval: float,
+        check_timeout: float,
+        write_window: float = 0.0,
+    ):
+        self.replicas = replicas
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.write_window = write_window
+        self._last_write = float("-inf")
+        self._cycle = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    def note_write(self, paths: Iterable[str] = ()) -> None:
+        """Invalidation listener: pin reads to the primary for `write_window`."""
+        self._last_write = time.monotonic()
+
+    def pinned(self) -> bool:
+        """Whether a write happened within the last `write_window` seconds."""
+        return time.monotonic() - self._last_write < self.write_window
+
+    def pick(self) -> Optional[Replica]:
+        """Next healthy replica, or None when reads should use the primary."""
+        if self.pinned():
+            return None
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._cycle) % len(healthy)]
+
+    def mark_down(self, replica: Replica) -> None:
+        if replica.healthy:
+            logger.warning("Read replica %s marked unhealthy", replica.name)
+        replica.healthy = False
+        replica.down_since = replica.down_since or time.monotonic()
+        replica.failures += 1
+
+    async def _probe(self, replica: Replica) -> None:
+        async with replica.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def check(self, replica: Replica) -> bool:
+        try:
+            # The timeout covers connecting too: an unreachable host hangs there
+            await asyncio.wait_for(self._probe(replica), self.check_timeout)
+        except Exception:
+            self.mark_down(replica)
+            return False
+        if not replica.healthy:
+            logger.info("Read replica %s is healthy again", replica.name)
+        replica.healthy = True
+        replica.down_since = None
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+            await asyncio.sleep(self.check_interval)
+
+    def start(self) -> None:
+        if self.replicas and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> List[dict]:
+        return [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "failures": replica.failures,
+                "status": replica.engine.pool.status(),
+            }
+            for replica in self.replicas
+        ]
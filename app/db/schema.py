@@ -0,0 +1,111 @@
+"""Schema fingerprint for the startup fast path.
+
+`create_all` inspects the catalog for every table on each start. Instead,
+startup reads one row holding the hash of the DDL the models (and the
+search index) would emit, and runs DDL only when that hash changed.
+The fingerprint is stored only once `missing()` finds nothing left to
+migrate, so a schema that `create_all` cannot fix is checked again on
+every start.
+"""
+import hashlib
+from typing import List, Set
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+from app.db.search import POSTGRES_DDL, SQLITE_DDL
+
+schema_state = Table(
+    "schema_state",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+# Indexes replaced by ones whose columns and directions match the list sorts
+DROPPED_INDEXES = ["ix_experiences_order", "ix_projects_published_order"]
+
+
+def fingerprint(dialect) -> str:
+    """sha256 of the DDL for every model table and index on `dialect`."""
+    digest = hashlib.sha256()
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    for statement in SQLITE_DDL if dialect.name == "sqlite" else POSTGRES_DDL:
+        digest.update(statement.encode())
+    return digest.hexdigest()
+
+
+async def is_current(conn) -> bool:
+    """Whether the stored fingerprint matches the models."""
+    try:
+        stored = await conn.scalar(select(schema_state.c.fingerprint).where(schema_state.c.id == 1))
+    except DBAPIError:
+        # No schema_state table yet
+        await conn.rollback()
+        return False
+    return stored == fingerprint(conn.dialect)
+
+
+def _create_indexes(sync_conn) -> None:
+    # IF NOT EXISTS rather than checkfirst: SQLite does not reflect expression indexes
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            sync_conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+async def ensure_indexes(conn) -> None:
+    """Create model indexes that are missing on existing tables and drop
+    the ones in `DROPPED_INDEXES`.
+
+    `create_all` skips tables that already exist, indexes included.
+    """
+    for name in DROPPED_INDEXES:
+        await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    await conn.run_sync(_create_indexes)
+
+
+def _index_names(sync_conn, inspector, table_name: str) -> Set[str]:
+    if sync_conn.dialect.name == "sqlite":
+        # The inspector skips expression indexes on SQLite
+        rows = sync_conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+            {"table": table_name},
+        )
+        return set(rows.scalars())
+    return {index["name"] for index in inspector.get_indexes(table_name)}
+
+
+def _missing(sync_conn) -> List[str]:
+    inspector = inspect(sync_conn)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            missing.append(f"table {table.name}")
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        missing += [f"column {table.name}.{c.name}" for c in table.columns if c.name not in columns]
+        indexes = _index_names(sync_conn, inspector, table.name)
+        missing += [f"index {index.name}" for index in table.indexes if index.name not in indexes]
+    return missing
+
+
+async def missing(conn) -> List[str]:
+    """Tables, columns and indexes of the models that the database lacks.
+
+    `create_all` adds missing tables and `ensure_indexes` missing indexes;
+    new columns on existing tables need a migration.
+    """
+    return await conn.run_sync(_missing)
+
+
+async def store_fingerprint(conn) -> None:
+    await conn.run_sync(lambda sync_conn: schema_state.create(sync_conn, checkfirst=True))
+    await conn.execute(schema_state.delete().where(schema_state.c.id == 1))
+    await conn.execute(schema_state.insert().values(id=1, fingerprint=fingerprint(conn.dialect)))
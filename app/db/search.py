@@ -0,0 +1,260 @@
+"""Full-text search over published posts and projects.
+
+SQLite uses an FTS5 virtual table ranked with bm25(); Postgres uses a
+side table with a weighted tsvector, a GIN index and ts_rank_cd(). Both
+hold one row per document and are kept current by the post and project
+write handlers. Titles weigh more than bodies.
+
+Titles and bodies are stored HTML-escaped, so the highlighted titles and
+snippets returned by `search()` are safe HTML with only `<mark>` tags. On
+SQLite each document's rowid is derived from `(kind, ref_id)`, so updates
+and deletes are rowid lookups rather than scans of the UNINDEXED columns.
+"""
+import html
+import re
+from typing import List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select, text
+
+from app.db.pagination import decode_token, encode_token
+from app.models.post import Post
+from app.models.project import Project
+
+# Changed whenever stored documents change shape; an index without the
+# current marker is dropped and rebuilt on startup
+LAYOUT = "search layout 2"
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+    f"/* {LAYOUT} */ kind UNINDEXED, ref_id UNINDEXED, slug UNINDEXED, title, body, "
+    "tokenize='porter unicode61')",
+]
+
+POSTGRES_DDL = [
+    "CREATE TABLE IF NOT EXISTS search_index ("
+    "kind VARCHAR(16) NOT NULL, ref_id INTEGER NOT NULL, slug VARCHAR(255), "
+    "title TEXT, body TEXT, document TSVECTOR NOT NULL, "
+    "PRIMARY KEY (kind, ref_id))",
+    "CREATE INDEX IF NOT EXISTS ix_search_index_document ON search_index USING GIN (document)",
+    f"COMMENT ON TABLE search_index IS '{LAYOUT}'",
+]
+
+POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(:title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(:body, '')), 'B')"
+)
+
+KINDS = ("post", "project")
+KIND_IDS = {kind: i for i, kind in enumerate(KINDS)}
+
+
+def _dialect(db) -> str:
+    return db.get_bind().dialect.name
+
+
+def supported(db) -> bool:
+    return _dialect(db) in ("sqlite", "postgresql")
+
+
+async def ensure_search_index(conn) -> bool:
+    """Create the index if it is missing or has an older layout.
+
+    Returns True when it was (re)created and needs a backfill.
+    """
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        current = await conn.scalar(
+            text("SELECT sql FROM sqlite_master WHERE name = 'search_index'")
+        )
+        ddl = SQLITE_DDL
+    elif dialect == "postgresql":
+        current = await conn.scalar(
+            text("SELECT obj_description(to_regclass('search_index'), 'pg_class')")
+        )
+        ddl = POSTGRES_DDL
+    else:
+        return False
+    if current is not None and LAYOUT in current:
+        return False
+    await conn.execute(text("DROP TABLE IF EXISTS search_index"))
+    for statement in ddl:
+        await conn.execute(text(statement))
+    return True
+
+
+def document_rowid(kind: str, ref_id: int) -> int:
+    return ref_id * len(KINDS) + KIND_IDS[kind]
+
+
+def _document(kind: str, item, title: Optional[str], body: str) -> dict:
+    return {
+        "rowid": document_rowid(kind, item.id),
+        "kind": kind,
+        "ref_id": item.id,
+        "slug": item.slug,
+        "title": html.escape(title or "", quote=False),
+        "body": html.escape(body, quote=False),
+    }
+
+
+def post_document(post: Post) -> dict:
+    return _document("post", post, post.title, "\n".join(filter(None, [post.excerpt, post.content])))
+
+
+def project_document(project: Project) -> dict:
+    return _document("project", project, project.title, "\n".join(filter(None, [
+        project.description,
+        project.content,
+        " ".join(project.technologies or []),
+    ])))
+
+
+async def remove_document(db, kind: str, ref_id: int) -> None:
+    dialect = _dialect(db)
+    if dialect == "sqlite":
+        await db.execute(
+            text("DELETE FROM search_index WHERE rowid = :rowid"),
+            {"rowid": document_rowid(kind, ref_id)},
+        )
+    elif dialect == "postgresql":
+        await db.execute(
+            text("DELETE FROM search_index WHERE kind = :kind AND ref_id = :ref_id"),
+            {"kind": kind, "ref_id": ref_id},
+        )
+
+
+SQLITE_UPSERT = text(
+    "INSERT OR REPLACE INTO search_index (rowid, kind, ref_id, slug, title, body) "
+    "VALUES (:rowid, :kind, :ref_id, :slug, :title, :body)"
+)
+
+POSTGRES_UPSERT = text(
+    "INSERT INTO search_index (kind, ref_id, slug, title, body, document) "
+    f"VALUES (:kind, :ref_id, :slug, :title, :body, {POSTGRES_DOCUMENT}) "
+    "ON CONFLICT (kind, ref_id) DO UPDATE SET slug = EXCLUDED.slug, "
+    "title = EXCLUDED.title, body = EXCLUDED.body, document = EXCLUDED.document"
+)
+
+
+async def index_document(db, document: dict) -> None:
+    dialect = _dialect(db)
+    if dialect == "sqlite":
+        await db.execute(SQLITE_UPSERT, document)
+    elif dialect == "postgresql":
+        await db.execute(POSTGRES_UPSERT, document)
+
+
+async def index_post(db, post: Post) -> None:
+    """Index a post, or drop it from the index when it is not published."""
+    if post.is_published:
+        await index_document(db, post_document(post))
+    else:
+        await remove_document(db, "post", post.id)
+
+
+async def index_project(db, project: Project) -> None:
+    if project.is_published:
+        await index_document(db, project_document(project))
+    else:
+        await remove_document(db, "project", project.id)
+
+
+async def rebuild(db) -> int:
+    """Re-index every published post and project. Returns the document count."""
+    if not supported(db):
+        return 0
+    await db.execute(text("DELETE FROM search_index"))
+    count = 0
+    for model, to_document in ((Post, post_document), (Project, project_document)):
+        result = await db.stream(
+            select(model).where(model.is_published == True).execution_options(yield_per=500)
+        )
+        # One executemany per batch instead of a statement per document
+        statement = SQLITE_UPSERT if _dialect(db) == "sqlite" else POSTGRES_UPSERT
+        async for partition in result.scalars().partitions():
+            documents = [to_document(item) for item in partition]
+            await db.execute(statement, documents)
+            count += len(documents)
+    return count
+
+
+def _fts5_query(q: str) -> Optional[str]:
+    # Quote every term so user input cannot inject FTS5 syntax; the last
+    # term is a prefix match for search-as-you-type
+    terms = re.findall(r"\w+", q)
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+async def search(db, q: str, kinds: List[str], limit: int, cursor: Optional[str]) -> dict:
+    """Ranked matches with highlighted snippets, keyset-paginated on score."""
+    dialect = _dialect(db)
+    params = {"limit": limit + 1}
+    kind_params = {f"kind_{i}": kind for i, kind in enumerate(kinds)}
+    params.update(kind_params)
+    kind_filter = "kind IN (" + ", ".join(f":{name}" for name in kind_params) + ")"
+
+    if dialect == "sqlite":
+        match = _fts5_query(q)
+        if match is None:
+            return {"data": [], "total": None, "next_cursor": None}
+        params["q"] = match
+        inner = (
+            "SELECT kind, ref_id, slug, "
+            "highlight(search_index, 3, '<mark>', '</mark>') AS title, "
+            "snippet(search_index, 4, '<mark>', '</mark>', '…', 24) AS snippet, "
+            "-bm25(search_index, 0.0, 0.0, 0.0, 10.0, 1.0) AS score "
+            "FROM search_index WHERE search_index MATCH :q"
+        )
+    else:
+        params["q"] = q
+        inner = (
+            "SELECT kind, ref_id, slug, "
+            "ts_headline('english', title, websearch_to_tsquery('english', :q), "
+            "'StartSel=<mark>, StopSel=</mark>, HighlightAll=true') AS title, "
+            "ts_headline('english', coalesce(body, ''), websearch_to_tsquery('english', :q), "
+            "'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15') AS snippet, "
+            "ts_rank_cd(document, websearch_to_tsquery('english', :q))::float8 AS score "
+            "FROM search_index WHERE document @@ websearch_to_tsquery('english', :q)"
+        )
+
+    conditions = [kind_filter]
+    if cursor:
+        token = decode_token(cursor)
+        try:
+            params.update(c_score=float(token["s"]), c_kind=str(token["k"]), c_id=int(token["i"]))
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        conditions.append(
+            "(score < :c_score OR (score = :c_score AND "
+            "(kind > :c_kind OR (kind = :c_kind AND ref_id > :c_id))))"
+        )
+
+    sql = (
+        f"SELECT * FROM ({inner}) AS matches WHERE {' AND '.join(conditions)} "
+        "ORDER BY score DESC, kind, ref_id LIMIT :limit"
+    )
+    rows = (await db.execute(text(sql), params)).mappings().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_token({"s": last["score"], "k": last["kind"], "i": last["ref_id"]})
+
+    data = [
+        {
+            "type": row["kind"],
+            "id": row["ref_id"],
+            "slug": row["slug"],
+            "title": row["title"],
+            "snippet": row["snippet"],
+            "score": row["score"],
+        }
+        for row in rows
+    ]
+    return {"data": data, "total": None, "next_cursor": next_cursor}
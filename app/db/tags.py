@@ -0,0 +1,98 @@
+"""Normalized tag index over `Post.tags`, `Project.technologies` and
+`Experience.skills`.
+
+The JSON columns stay the source of truth; `content_tags` mirrors them
+and is rewritten for a row whenever that row is written. Like the search
+index, only published posts and projects are indexed, so lookups and
+counts need no join back to the content tables.
+"""
+from typing import Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+
+from app.models.experience import Experience
+from app.models.post import Post
+from app.models.project import Project
+from app.models.tag import ContentTag
+
+# kind -> (model, JSON column holding the tags)
+TAGGED = {
+    "post": (Post, "tags"),
+    "project": (Project, "technologies"),
+    "experience": (Experience, "skills"),
+}
+
+
+def normalize_tag(tag: str) -> str:
+    return " ".join(tag.split()).lower()[:100]
+
+
+def tagged(kind: str, model, tag: str):
+    """Filter clause for rows of `model` carrying `tag`, answered from the index."""
+    ref_ids = select(ContentTag.ref_id).where(
+        ContentTag.kind == kind, ContentTag.tag_norm == normalize_tag(tag)
+    )
+    return model.id.in_(ref_ids)
+
+
+def _rows(kind: str, ref_id: int, tags: Iterable[str]) -> List[dict]:
+    rows = {}
+    for tag in tags or []:
+        if not isinstance(tag, str):
+            continue
+        norm = normalize_tag(tag)
+        if norm and norm not in rows:
+            rows[norm] = {"kind": kind, "ref_id": ref_id, "tag": tag.strip()[:100], "tag_norm": norm}
+    return list(rows.values())
+
+
+async def remove_tags(db, kind: str, ref_id: int) -> None:
+    await db.execute(
+        delete(ContentTag).where(ContentTag.kind == kind, ContentTag.ref_id == ref_id)
+    )
+
+
+async def sync_tags(db, kind: str, item) -> None:
+    """Rewrite the index rows for one post, project or experience entry."""
+    model, column = TAGGED[kind]
+    await remove_tags(db, kind, item.id)
+    if not getattr(item, "is_published", True):
+        return
+    rows = _rows(kind, item.id, getattr(item, column))
+    if rows:
+        await db.execute(insert(ContentTag), rows)
+
+
+async def rebuild(db) -> int:
+    """Rebuild the whole index from the JSON columns. Returns the row count."""
+    await db.execute(delete(ContentTag))
+    count = 0
+    for kind, (model, column) in TAGGED.items():
+        query = select(model.id, getattr(model, column))
+        if hasattr(model, "is_published"):
+            query = query.where(model.is_published == True)
+        rows = []
+        for ref_id, tags in (await db.execute(query)).all():
+            rows.extend(_rows(kind, ref_id, tags))
+        if rows:
+            await db.execute(insert(ContentTag), rows)
+        count += len(rows)
+    return count
+
+
+async def tag_counts(db, kind: Optional[str] = None, limit: int = 100) -> List[dict]:
+    """Most used tags first; `kind=None` counts across all content types."""
+    count = func.count().label("count")
+    query = select(func.min(ContentTag.tag).label("tag"), ContentTag.tag_norm, count)
+    if kind:
+        query = query.where(ContentTag.kind == kind)
+    query = (
+        query.group_by(ContentTag.tag_norm)
+        .order_by(count.desc(), ContentTag.tag_norm)
+        .limit(limit)
+    )
+    result = await db.execute(query)
+    return [
+        {"tag": row.tag, "slug": row.tag_norm, "count": row.count}
+        for row in result
+    ]
@@ -0,0 +1,84 @@
+"""Per-table write versions for HTTP validators.
+
+Every session commit that wrote to a table bumps that table's row in
+`table_versions` inside the same transaction, so validators read one
+indexed row instead of aggregating the content table, and a same-second
+update still changes the version. Writes made through a Session are
+tracked: ORM flushes and Core DML alike. Code writing on a bare
+connection calls `bump()` itself.
+"""
+from typing import Iterable, Optional
+
+from sqlalchemy import event, select, text
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, object_mapper
+
+from app.models.table_version import TableVersion
+
+BUMP = text(
+    "INSERT INTO table_versions (name, version, updated_at) "
+    "VALUES (:name, 1, CURRENT_TIMESTAMP) "
+    "ON CONFLICT (name) DO UPDATE SET "
+    "version = table_versions.version + 1, updated_at = CURRENT_TIMESTAMP"
+)
+
+
+def _mark(session: Session, name: str) -> None:
+    if name != TableVersion.__tablename__:
+        session.info.setdefault("written_tables", set()).add(name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        if table is not None:
+            _mark(state.session, table.name)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session: Session, flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        _mark(session, object_mapper(obj).local_table.name)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_written_tables(session: Session) -> None:
+    # Flush first: commit would otherwise flush after this hook
+    session.flush()
+    names = session.info.pop("written_tables", None)
+    if names:
+        # Sorted so concurrent writers take the row locks in the same order
+        session.execute(BUMP, [{"name": name} for name in sorted(names)])
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_written_tables(session: Session) -> None:
+    session.info.pop("written_tables", None)
+
+
+async def bump(conn, names: Iterable[str]) -> None:
+    """Bump versions for writes made outside a Session."""
+    names = sorted(set(names))
+    if names:
+        await conn.execute(BUMP, [{"name": name} for name in names])
+
+
+async def table_version(db, model) -> Optional[Row]:
+    """`(version, updated_at)` for `model`'s table, or None before its first write."""
+    result = await db.execute(
+        select(TableVersion.version, TableVersion.updated_at)
+        .where(TableVersion.name == model.__tablename__)
+    )
+    return result.one_or_none()
+
+
+def version_column(model):
+    """`model`'s table version as a scalar subquery, to select with row columns."""
+    return (
+        select(TableVersion.version)
+        .where(TableVersion.name == model.__tablename__)
+        .scalar_subquery()
+    )
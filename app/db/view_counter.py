@@ -0,0 +1,97 @@
+"""Write-behind view counter for blog posts.
+
+Reads record views in memory; a background task flushes the buffered
+counts with one batched `UPDATE posts SET views = views + n` per interval.
+"""
+import asyncio
+import logging
+from collections import Counter
+from typing import Optional
+
+from sqlalchemy import bindparam, update
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.models.post import Post
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class ViewCounter:
+    def __init__(self, interval: float, threshold: int):
+        self.interval = interval
+        self.threshold = threshold
+        self._pending: Counter = Counter()
+        self._pending_total = 0
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+
+    def record(self, post_id: int, n: int = 1) -> None:
+        self._pending[post_id] += n
+        self._pending_total += n
+        if self._pending_total >= self.threshold:
+            self._wakeup.set()
+
+    def pending(self, post_id: int) -> int:
+        """Views recorded for `post_id` that have not been flushed yet."""
+        return self._pending.get(post_id, 0)
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, Counter()
+            self._pending_total = 0
+            # Keyed by id: a slug can change between the read and the flush
+            params = [{"b_id": post_id, "b_n": n} for post_id, n in batch.items()]
+            stmt = (
+                update(Post.__table__)
+                .where(Post.__table__.c.id == bindparam("b_id"))
+                .values(views=Post.__table__.c.views + bindparam("b_n"))
+            )
+            try:
+                async with AsyncSessionLocal() as session:
+                    await session.execute(stmt, params)
+                    await session.commit()
+            except Exception:
+                # Put the counts back so the next flush retries them
+                self._pending.update(batch)
+                self._pending_total += sum(batch.values())
+                raise
+            return sum(batch.values())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush post view counts")
+
+    def start(self) -> None:
+        if self._task is None:
+            # Bind the primitives to the running loop
+            self._flush_lock = asyncio.Lock()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+post_views = ViewCounter(
+    interval=settings.VIEW_FLUSH_INTERVAL,
+    threshold=settings.VIEW_FLUSH_THRESHOLD,
+)
@@ -5,6 +5,9 @@ from app.models.post import Post
 from app.models.skill import Skill
 from app.models.experience import Experience
 from app.models.contact import Contact
+from app.models.tag import ContentTag
+from app.models.stored_file import StoredFile
+from app.models.table_version import TableVersion
 
 __all__ = [
     "User",
@@ -14,4 +17,7 @@ __all__ = [
     "Skill",
     "Experience",
     "Contact",
+    "ContentTag",
+    "StoredFile",
+    "TableVersion",
 ]
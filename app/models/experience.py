@@ -1,10 +1,9 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON, Index, literal_column
 from sqlalchemy.sql import func
 from app.db.database import Base
 
 class Experience(Base):
     __tablename__ = "experiences"
-    
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
     organization = Column(String(255), nullable=False)
@@ -18,3 +17,8 @@ class Experience(Base):
     order = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+# start_date is nullable; the keyset sort and its index share this expression
+start_date_key = func.coalesce(Experience.start_date, literal_column("''"))
+
+Index("ix_experiences_order_start", Experience.order, start_date_key.desc(), Experience.id)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from app.db.database import Base
 
@@ -22,3 +22,6 @@ class Project(Base):
     order = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+# Matches the list sort: order ASC, created_at DESC, id DESC
+Index("ix_projects_published_order_created", Project.is_published, Project.order, Project.created_at.desc(), Project.id.desc())
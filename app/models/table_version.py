@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+class TableVersion(Base):
+    """Write counter per content table, bumped in the writing transaction.
+
+    HTTP validators are built from it instead of row timestamps, which
+    SQLite stores with one-second resolution.
+    """
+    __tablename__ = "table_versions"
+    
+    name = Column(String(64), primary_key=True)
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, Index, UniqueConstraint
+from app.db.database import Base
+
+class ContentTag(Base):
+    """One row per tag on a published post or project, or an experience entry.
+
+    Maintained by the write endpoints (see app.db.tags) so tag filters and
+    tag counts are index lookups instead of scans over the JSON columns.
+    """
+    __tablename__ = "content_tags"
+    __table_args__ = (
+        UniqueConstraint("kind", "ref_id", "tag_norm", name="uq_content_tags_ref_tag"),
+        Index("ix_content_tags_kind_tag", "kind", "tag_norm", "ref_id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(16), nullable=False)  # post, project, experience
+    ref_id = Column(Integer, nullable=False)
+    tag = Column(String(100), nullable=False)
+    tag_norm = Column(String(100), nullable=False)
@@ -1,17 +1,22 @@
 from app.schemas.user import UserCreate, UserUpdate, UserResponse, Token, TokenData
 from app.schemas.profile import ProfileCreate, ProfileUpdate, ProfileResponse
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
-from app.schemas.post import PostCreate, PostUpdate, PostResponse
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectSummary
+from app.schemas.post import PostCreate, PostUpdate, PostResponse, PostSummary
 from app.schemas.skill import SkillCreate, SkillUpdate, SkillResponse
 from app.schemas.experience import ExperienceCreate, ExperienceUpdate, ExperienceResponse
-from app.schemas.contact import ContactCreate, ContactUpdate, ContactResponse
+from app.schemas.contact import ContactCreate, ContactUpdate, ContactResponse, ContactPage
+from app.schemas.pagination import Page
+from app.schemas.search import SearchResult
+from app.schemas.tag import TagCount
+from app.schemas.bulk import IdList, BulkResult, ReorderResult
 
 __all__ = [
     "UserCreate", "UserUpdate", "UserResponse", "Token", "TokenData",
     "ProfileCreate", "ProfileUpdate", "ProfileResponse",
-    "ProjectCreate", "ProjectUpdate", "ProjectResponse",
-    "PostCreate", "PostUpdate", "PostResponse",
+    "ProjectCreate", "ProjectUpdate", "ProjectResponse", "ProjectSummary",
+    "PostCreate", "PostUpdate", "PostResponse", "PostSummary",
     "SkillCreate", "SkillUpdate", "SkillResponse",
     "ExperienceCreate", "ExperienceUpdate", "ExperienceResponse",
-    "ContactCreate", "ContactUpdate", "ContactResponse",
+    "ContactCreate", "ContactUpdate", "ContactResponse", "ContactPage",
+    "Page", "SearchResult", "TagCount", "IdList", "BulkResult", "ReorderResult",
 ]
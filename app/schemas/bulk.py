@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class IdList(BaseModel):
+    ids: List[int]
+
+class BulkResult(BaseModel):
+    id: int
+    status: str
+
+class ReorderResult(BulkResult):
+    order: Optional[int] = None
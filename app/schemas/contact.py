@@ -2,6 +2,8 @@ from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime
 
+from app.schemas.pagination import Page
+
 class ContactBase(BaseModel):
     name: str
     email: EmailStr
@@ -21,3 +23,6 @@ class ContactResponse(ContactBase):
 
     class Config:
         from_attributes = True
+
+class ContactPage(Page[ContactResponse]):
+    unread: int = 0
@@ -29,6 +29,9 @@ class ExperienceUpdate(BaseModel):
     is_current: Optional[bool] = None
     order: Optional[int] = None
 
+class ExperienceBulkUpdate(ExperienceUpdate):
+    id: int
+
 class ExperienceResponse(ExperienceBase):
     id: int
     created_at: datetime
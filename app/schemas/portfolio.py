@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.schemas.profile import ProfileResponse
+from app.schemas.project import ProjectResponse
+from app.schemas.skill import SkillResponse
+from app.schemas.experience import ExperienceResponse
+from app.schemas.testimonial import TestimonialOut
+from app.schemas.service import ServiceOut
+
+class PortfolioBundle(BaseModel):
+    profile: Optional[ProfileResponse] = None
+    projects: Optional[List[ProjectResponse]] = None
+    skills: Optional[List[SkillResponse]] = None
+    experience: Optional[List[ExperienceResponse]] = None
+    testimonials: Optional[List[TestimonialOut]] = None
+    services: Optional[List[ServiceOut]] = None
@@ -35,3 +35,19 @@ class PostResponse(PostBase):
 
     class Config:
         from_attributes = True
+
+class PostSummary(BaseModel):
+    id: int
+    title: str
+    slug: str
+    excerpt: Optional[str] = None
+    image: Optional[str] = None
+    category: Optional[str] = None
+    tags: Optional[List[str]] = []
+    read_time: int = 5
+    views: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -36,6 +36,9 @@ class ProjectUpdate(BaseModel):
     is_published: Optional[bool] = None
     order: Optional[int] = None
 
+class ProjectBulkUpdate(ProjectUpdate):
+    id: int
+
 class ProjectResponse(ProjectBase):
     id: int
     slug: str
@@ -44,3 +47,22 @@ class ProjectResponse(ProjectBase):
 
     class Config:
         from_attributes = True
+
+class ProjectSummary(BaseModel):
+    id: int
+    title: str
+    slug: str
+    description: Optional[str] = None
+    image: Optional[str] = None
+    category: Optional[str] = None
+    technologies: Optional[List[str]] = []
+    github_url: Optional[str] = None
+    live_url: Optional[str] = None
+    year: Optional[str] = None
+    is_featured: bool = False
+    order: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Literal
+
+class SearchResult(BaseModel):
+    type: Literal["post", "project"]
+    id: int
+    slug: str
+    title: str
+    snippet: str
+    score: float
@@ -17,6 +17,10 @@ class ServiceUpdate(ServiceBase):
     pass
 
 
+class ServiceBulkUpdate(ServiceUpdate):
+    id: int
+
+
 class ServiceOut(ServiceBase):
     id: int
 
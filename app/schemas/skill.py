@@ -25,6 +25,9 @@ class SkillUpdate(BaseModel):
     is_active: Optional[bool] = None
     order: Optional[int] = None
 
+class SkillBulkUpdate(SkillUpdate):
+    id: int
+
 class SkillResponse(SkillBase):
     id: int
     created_at: datetime
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+class TagCount(BaseModel):
+    tag: str
+    slug: str
+    count: int
@@ -17,6 +17,10 @@ class TestimonialUpdate(TestimonialBase):
     pass
 
 
+class TestimonialBulkUpdate(TestimonialUpdate):
+    id: int
+
+
 class TestimonialOut(TestimonialBase):
     id: int
 
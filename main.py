@@ -1,29 +1,112 @@
+from app.core.startup import startup_timer  # first, so module imports are timed
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import asyncio
 import os
 
 from app.core.config import settings
-from app.api.v1.router import api_router
-from app.db.database import engine, Base
+from app.api.v1.router import api_router, CACHED_PREFIXES
+from app.core.cache import (
+    ResponseCacheMiddleware,
+    response_cache,
+    add_invalidation_listener,
+    remove_invalidation_listener,
+)
+from app.core.compression import CompressionMiddleware, compressed_memo
+from app.core.snapshot import SnapshotWriter
+from app.core import images
+from app.core.security import shutdown_hash_executor
+from app.core.media import MediaFiles
+from app.core.storage import UploadLimitMiddleware
+from app.db.database import engine, read_engine, replica_router, AsyncSessionLocal, ReadSessionLocal, Base
+from app.db import schema
+from app.db.search import ensure_search_index, rebuild as rebuild_search_index
+from app.db.tags import rebuild as rebuild_tag_index
+from app.models.post import Post
+from app.models.tag import ContentTag
+from sqlalchemy import inspect, select
+from app.db.view_counter import post_views
 import logging
 
 logger = logging.getLogger("uvicorn.error")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    startup_timer.mark("import")
     # Startup: try to create tables but don't raise on failure
     try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        async with engine.connect() as conn:
+            startup_timer.mark("engine")
+            # One query instead of create_all's catalog inspection when the
+            # stored fingerprint shows the schema is already current
+            current = settings.SCHEMA_FINGERPRINT_CHECK and await schema.is_current(conn)
+        startup_timer.mark("schema_check")
+        if current:
+            startup_timer.schema = "current"
+        else:
+            async with engine.begin() as conn:
+                created_tag_index = not await conn.run_sync(
+                    lambda sync_conn: inspect(sync_conn).has_table(ContentTag.__tablename__)
+                )
+                await conn.run_sync(Base.metadata.create_all)
+                await schema.ensure_indexes(conn)
+                created_search_index = await ensure_search_index(conn)
+            if created_search_index or created_tag_index:
+                # First start with a new index: backfill it from existing content
+                async with AsyncSessionLocal() as session:
+                    if created_search_index:
+                        await rebuild_search_index(session)
+                    if created_tag_index:
+                        await rebuild_tag_index(session)
+                    await session.commit()
+            async with engine.begin() as conn:
+                missing = await schema.missing(conn)
+                if missing:
+                    # Leave the fingerprint stale so the next start checks again
+                    logger.error(
+                        "Database schema is out of date, run a migration: missing %s",
+                        ", ".join(missing),
+                    )
+                    startup_timer.schema = "out_of_date"
+                else:
+                    await schema.store_fingerprint(conn)
+                    startup_timer.schema = "migrated"
+            startup_timer.mark("schema_ddl")
+        async with ReadSessionLocal() as session:
+            await session.execute(select(Post.id).limit(1))
+        startup_timer.mark("first_query")
     except Exception as e:
         # Log the error and continue so the serverless function doesn't fail to start
+        startup_timer.schema = "failed"
         logger.exception("Database initialization failed during startup: %s", e)
+    startup_timer.finish()
+    post_views.start()
+    replica_router.start()
+    add_invalidation_listener(replica_router.note_write)
+    snapshot = None
+    if settings.STATIC_EXPORT_DIR:
+        snapshot = SnapshotWriter(app, settings.STATIC_EXPORT_DIR)
+        add_invalidation_listener(snapshot.mark_dirty)
     yield
+    remove_invalidation_listener(replica_router.note_write)
+    if snapshot is not None:
+        remove_invalidation_listener(snapshot.mark_dirty)
     # Shutdown
+    try:
+        await post_views.stop()
+    except Exception:
+        logger.exception("Error flushing post views during shutdown")
+    await asyncio.to_thread(images.shutdown)
+    await asyncio.to_thread(shutdown_hash_executor)
+    try:
+        await replica_router.stop()
+    except Exception:
+        logger.exception("Error stopping read replicas during shutdown")
     try:
         await engine.dispose()
+        if read_engine is not engine:
+            await read_engine.dispose()
     except Exception:
         logger.exception("Error disposing engine during shutdown")
 
@@ -35,6 +118,31 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Response cache for public GET routes (inside CORS so hits get CORS headers)
+if settings.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        cache=response_cache,
+        prefixes=[f"{settings.API_V1_STR}{prefix}" for prefix in CACHED_PREFIXES],
+    )
+
+# Compression sits outside the response cache so cached hits are compressed
+# too; /uploads serves its own precompressed files
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        memo=compressed_memo,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        exclude_prefixes=["/uploads"],
+    )
+
+# Refuse oversized uploads before the multipart parser spools them to disk
+app.add_middleware(
+    UploadLimitMiddleware,
+    prefixes=[f"{settings.API_V1_STR}/upload"],
+    max_size=settings.MAX_UPLOAD_SIZE,
+)
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -42,11 +150,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],
 )
 
 # Mount static files
-os.makedirs("uploads", exist_ok=True)
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+app.mount("/uploads", MediaFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
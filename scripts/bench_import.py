@@ -0,0 +1,84 @@
+"""Measure how long `import main` takes, as on a serverless cold start.
+
+Usage: python -m scripts.bench_import [--runs 5] [--top 15] [--budget-ms 0]
+
+Each run imports the app in a fresh interpreter. The report gives the
+median wall time, the packages with the most import time (from
+`python -X importtime`), and fails if a dependency that should load on
+first use (`LAZY_MODULES`) is imported at startup, or if the median
+exceeds `--budget-ms`.
+"""
+import argparse
+import collections
+import re
+import statistics
+import subprocess
+import sys
+
+# Loaded by the handlers that need them, never at import time
+LAZY_MODULES = ("PIL", "jose", "passlib", "bcrypt", "slugify")
+
+TIMED_IMPORT = (
+    "import sys, time\n"
+    "started = time.perf_counter()\n"
+    "import main\n"
+    "print(time.perf_counter() - started)\n"
+    "print(','.join(sorted({name.split('.')[0] for name in sys.modules})))\n"
+)
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def timed_import():
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", TIMED_IMPORT],
+        capture_output=True, text=True, check=True,
+    ).stdout.splitlines()
+    return float(out[-2]), set(out[-1].split(","))
+
+
+def self_time_by_package() -> collections.Counter:
+    stderr = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", "import main"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    totals = collections.Counter()
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            totals[match[4].split(".")[0]] += int(match[1])
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=0, help="fail above this median (0: no budget)")
+    args = parser.parse_args()
+
+    times = []
+    loaded = set()
+    for _ in range(args.runs):
+        seconds, modules = timed_import()
+        times.append(seconds * 1000)
+        loaded = modules
+    median = statistics.median(times)
+    print(f"import main: median {median:.0f}ms, min {min(times):.0f}ms over {args.runs} runs")
+
+    print(f"\n{'package':<24} {'self ms':>8}")
+    for package, micros in self_time_by_package().most_common(args.top):
+        print(f"{package:<24} {micros / 1000:>8.1f}")
+
+    failures = []
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    if eager:
+        failures.append(f"imported at startup: {', '.join(eager)}")
+    if args.budget_ms and median > args.budget_ms:
+        failures.append(f"median {median:.0f}ms exceeds budget {args.budget_ms:.0f}ms")
+    for failure in failures:
+        print(f"\nFAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Measure request latency on the event loop during a login burst.
+
+Usage: python -m scripts.bench_login [--logins 40] [--concurrency 16]
+
+Runs the app in-process on a throwaway SQLite database. While `--logins`
+logins run with `--concurrency` in flight, a probe requests `/health`
+every 10ms and records how late its response arrives. `inline` verifies bcrypt hashes on the
+event loop (the previous behaviour), `pool` uses the bounded hashing pool
+from `app.core.security`, and `idle` is the probe alone for reference.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db")
+
+import httpx
+
+from app.api.v1.endpoints import auth
+from app.core.security import get_hash_stats, verify_password
+from main import app
+
+EMAIL = "bench@example.com"
+PASSWORD = "bench-password"
+
+
+async def verify_inline(plain_password: str, hashed_password: str) -> bool:
+    return verify_password(plain_password, hashed_password)
+
+
+async def run_mode(client: httpx.AsyncClient, mode: str, args) -> dict:
+    pooled = auth.verify_password_async
+    if mode == "inline":
+        auth.verify_password_async = verify_inline
+    latencies = []
+    statuses = Counter()
+    finished = asyncio.Event()
+
+    async def probe():
+        # Latency counts from when the probe was due, so time spent waiting
+        # for a blocked event loop is included
+        while not finished.is_set():
+            due = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            await client.get("/health")
+            latencies.append(time.perf_counter() - due)
+
+    slots = asyncio.Semaphore(args.concurrency)
+
+    async def login():
+        async with slots:
+            response = await client.post("/api/auth/login", data={"username": EMAIL, "password": PASSWORD})
+            statuses[response.status_code] += 1
+
+    started = time.perf_counter()
+    probe_task = asyncio.create_task(probe())
+    try:
+        if mode == "idle":
+            await asyncio.sleep(1.0)
+        else:
+            await asyncio.gather(*(login() for _ in range(args.logins)))
+    finally:
+        finished.set()
+        await probe_task
+        auth.verify_password_async = pooled
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "logins/s": sum(statuses.values()) / elapsed if statuses else 0.0,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1000,
+        "max": latencies[-1] * 1000,
+        "statuses": dict(statuses),
+    }
+
+
+async def main_async(args):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await client.post("/api/auth/register", json={"email": EMAIL, "password": PASSWORD, "full_name": "Bench"})
+            await client.get("/health")
+            print(f"{'mode':<8} {'logins/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}  statuses")
+            for mode in ("idle", "inline", "pool"):
+                result = await run_mode(client, mode, args)
+                print(
+                    f"{mode:<8} {result['logins/s']:>9.1f} {result['p50']:>8.1f} "
+                    f"{result['p99']:>8.1f} {result['max']:>8.1f}  {result['statuses']}"
+                )
+            print("hashing pool:", get_hash_stats())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=16)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
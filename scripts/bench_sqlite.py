@@ -0,0 +1,96 @@
+"""Compare SQLite read/write concurrency with and without performance mode.
+
+Usage: python -m scripts.bench_sqlite [--readers 16] [--writers 4] [--seconds 5]
+
+Each mode gets a fresh database file. Readers page through published posts
+while writers insert contact messages and bump post views, the same mix
+the public site produces.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.database import Base, create_engines
+from app.models.contact import Contact
+from app.models.post import Post
+
+
+async def run_mode(tuned: bool, args) -> dict:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    url = f"sqlite+aiosqlite:///{path}"
+    write_engine, read_engine = create_engines(url, "long_lived", sqlite_tuned=tuned)
+    WriteSession = async_sessionmaker(write_engine, class_=AsyncSession, expire_on_commit=False)
+    ReadSession = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with write_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Post.__table__), [
+            {"title": f"Post {i}", "slug": f"post-{i}", "content": "x" * 2000, "views": 0}
+            for i in range(args.rows)
+        ])
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    deadline = time.perf_counter() + args.seconds
+
+    async def reader():
+        while time.perf_counter() < deadline:
+            async with ReadSession() as session:
+                await session.execute(
+                    select(Post).where(Post.is_published == True).order_by(Post.created_at.desc()).limit(20)
+                )
+            counts["reads"] += 1
+
+    async def writer(n: int):
+        i = 0
+        while time.perf_counter() < deadline:
+            try:
+                async with WriteSession() as session:
+                    await session.execute(insert(Contact.__table__).values(
+                        name="Bench", email="bench@example.com", message=f"{n}-{i}"
+                    ))
+                    await session.execute(
+                        update(Post.__table__).where(Post.__table__.c.id == (i % args.rows) + 1)
+                        .values(views=Post.__table__.c.views + 1)
+                    )
+                    await session.commit()
+                counts["writes"] += 1
+            except OperationalError:
+                counts["errors"] += 1
+            i += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[reader() for _ in range(args.readers)], *[writer(n) for n in range(args.writers)])
+    elapsed = time.perf_counter() - started
+
+    await write_engine.dispose()
+    if read_engine is not write_engine:
+        await read_engine.dispose()
+    return {
+        "reads/s": counts["reads"] / elapsed,
+        "writes/s": counts["writes"] / elapsed,
+        "errors": counts["errors"],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'reads/s':>10} {'writes/s':>10} {'errors':>8}")
+    for label, tuned in (("default", False), ("tuned", True)):
+        result = await run_mode(tuned, args)
+        print(f"{label:<10} {result['reads/s']:>10.0f} {result['writes/s']:>10.0f} {result['errors']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""Export or import all CMS content as NDJSON.
+
+Usage:
+    python -m scripts.content_io export [FILE]   (stdout when FILE is omitted)
+    python -m scripts.content_io import FILE     (- reads stdin)
+
+The format and upsert rules are those of `GET /api/admin/export` and
+`POST /api/admin/import` (see `app/db/content_io.py`). A running API keeps
+serving cached responses until they expire; call `DELETE /api/admin/cache`
+after importing behind its back. Missing tables are created first, so
+an export can be loaded into an empty database.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from app.db.content_io import InvalidImport, export_stream, import_lines, iter_lines
+from app.db.database import AsyncSessionLocal, Base, engine
+from app.db.search import ensure_search_index
+
+
+async def file_chunks(stream, size: int = 64 * 1024):
+    while chunk := stream.read(size):
+        yield chunk
+
+
+async def export(path: str) -> None:
+    out = sys.stdout.buffer if path == "-" else open(path, "wb")
+    try:
+        async for chunk in export_stream(engine):
+            out.write(chunk)
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+
+
+async def import_(path: str) -> None:
+    source = sys.stdin.buffer if path == "-" else open(path, "rb")
+    started = time.perf_counter()
+    # The target may be a fresh database
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await ensure_search_index(conn)
+    try:
+        async with AsyncSessionLocal() as session:
+            counts = await import_lines(session, iter_lines(file_chunks(source)))
+    except InvalidImport as e:
+        sys.exit(f"Import failed: {e}")
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+    for table, rows in counts.items():
+        print(f"{table:<14} {rows:>8}")
+    print(f"Imported {sum(counts.values())} rows in {time.perf_counter() - started:.2f}s.")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("export").add_argument("file", nargs="?", default="-")
+    commands.add_parser("import").add_argument("file")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "export":
+            await export(args.file)
+        else:
+            await import_(args.file)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,30 @@
+"""Render every public GET response to static JSON files.
+
+Usage: python -m scripts.export_static [OUT_DIR]
+
+OUT_DIR defaults to STATIC_EXPORT_DIR, or ./static when that is unset.
+Serve the output from static storage with `<path>` rewritten to
+`<path>.json`; the API then only has to handle admin writes.
+"""
+import asyncio
+import sys
+import time
+
+from app.core.config import settings
+from app.core.snapshot import SnapshotWriter
+from app.db.database import engine
+from main import app
+
+
+async def main():
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else (settings.STATIC_EXPORT_DIR or "static")
+
+    print(f"Exporting public API to {out_dir}...")
+    started = time.perf_counter()
+    written = await SnapshotWriter(app, out_dir).export_all()
+    await engine.dispose()
+    print(f"Wrote {written} documents in {time.perf_counter() - started:.2f}s.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,7 +1,29 @@
+"""Create the tables and seed demo content.
+
+Usage:
+    python -m scripts.seed
+    python -m scripts.seed --synthetic --posts 100000 --contacts 1000000 [--seed 1]
+
+`--synthetic` generates N rows per model with bulk Core inserts in chunks
+of `--chunk-size`, from a fixed seed so the same arguments always produce
+the same dataset, and reports rows per second. Slugs include the seed, so
+use another `--seed` to add more rows to an existing database.
+"""
+import argparse
 import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db import search, tags, versions
 from app.db.database import engine, AsyncSessionLocal, Base
+from app.db.search import ensure_search_index
+from app.models.contact import Contact
+from app.models.experience import Experience
 from app.models.project import Project
 from app.models.post import Post
 from app.models.skill import Skill
@@ -12,6 +34,7 @@ from app.models.service import Service
 async def create_tables():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await ensure_search_index(conn)
 
 
 async def seed():
@@ -71,11 +94,186 @@ async def seed():
         await session.commit()
 
 
+# Synthetic data for load testing
+
+WORDS = (
+    "api async cache client cloud component data database deploy design docker edge event "
+    "feature frontend graph index latency layout migration model module network pipeline "
+    "platform query queue render request schema search server service session storage "
+    "stream system test token traffic type update user version worker build release review"
+).split()
+TAGS = (
+    "Python FastAPI React TypeScript Postgres SQLite Docker Kubernetes AWS Rust Go Redis "
+    "GraphQL Testing Performance Security DevOps CSS Design Career Tutorial Architecture "
+    "Serverless Vue Svelte Django Node Linux Git Observability"
+).split()
+CATEGORIES = ["Engineering", "Web App", "API", "Tooling", "Data", "Mobile", "Notes"]
+BASE_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+DEFAULT_COUNTS = {
+    "posts": 1000, "projects": 200, "skills": 50, "experience": 50,
+    "testimonials": 50, "services": 10, "contacts": 10000,
+}
+
+
+def _corpus(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(30000))
+
+
+def _text(rng: random.Random, corpus: str, mean_length: float) -> str:
+    # Log-normal lengths: mostly short, with a long tail of large bodies
+    length = int(min(len(corpus) - 1, max(80, rng.lognormvariate(0, 0.9) * mean_length)))
+    start = rng.randrange(len(corpus) - length)
+    return corpus[start:start + length]
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))).capitalize()
+
+
+def _tags(rng: random.Random, most: int) -> list:
+    # Zipf-like: a few tags are everywhere, most are rare
+    picked = rng.choices(TAGS, weights=[1 / rank for rank in range(1, len(TAGS) + 1)], k=rng.randint(0, most))
+    return list(dict.fromkeys(picked))
+
+
+def _created(rng: random.Random) -> datetime:
+    return BASE_DATE + timedelta(seconds=rng.randrange(2 * 365 * 86400))
+
+
+def synthetic_posts(rng, count, corpus, seed):
+    for i in range(count):
+        content = _text(rng, corpus, 3000)
+        yield {
+            "title": _title(rng), "slug": f"post-{seed}-{i}", "excerpt": _text(rng, corpus, 160),
+            "content": content, "image": f"/uploads/images/{seed}-{i}.webp",
+            "category": rng.choice(CATEGORIES), "tags": _tags(rng, 5),
+            "read_time": max(1, len(content) // 1200), "is_published": rng.random() < 0.9,
+            "views": int(rng.paretovariate(1.2) * 10), "created_at": _created(rng),
+        }
+
+
+def synthetic_projects(rng, count, corpus, seed):
+    for i in range(count):
+        yield {
+            "title": _title(rng), "slug": f"project-{seed}-{i}", "description": _text(rng, corpus, 200),
+            "content": _text(rng, corpus, 2000), "image": f"/uploads/images/p{seed}-{i}.webp",
+            "category": rng.choice(CATEGORIES), "technologies": _tags(rng, 6),
+            "features": [_title(rng) for _ in range(rng.randint(0, 4))],
+            "github_url": f"https://github.com/example/project-{i}", "year": str(rng.randint(2015, 2025)),
+            "is_featured": rng.random() < 0.1, "is_published": rng.random() < 0.9,
+            "order": i, "created_at": _created(rng),
+        }
+
+
+def synthetic_skills(rng, count, corpus, seed):
+    for i in range(count):
+        yield {
+            "name": f"{rng.choice(TAGS)} {i}", "category": rng.choice(["Language", "Framework", "Tool"]),
+            "level": rng.choice(["Beginner", "Intermediate", "Advanced", "Expert"]),
+            "proficiency": rng.randint(10, 100), "is_active": rng.random() < 0.95, "order": i,
+            "created_at": _created(rng),
+        }
+
+
+def synthetic_experience(rng, count, corpus, seed):
+    for i in range(count):
+        start = rng.randint(2005, 2024)
+        yield {
+            "title": _title(rng), "organization": f"{rng.choice(WORDS).capitalize()} Labs",
+            "type": rng.choice(["Work", "Education", "Certification"]), "location": "Remote",
+            "description": _text(rng, corpus, 400), "skills": _tags(rng, 6),
+            "start_date": f"{start}-{rng.randint(1, 12):02d}", "end_date": f"{start + rng.randint(1, 4)}-01",
+            "order": i, "created_at": _created(rng),
+        }
+
+
+def synthetic_testimonials(rng, count, corpus, seed):
+    for i in range(count):
+        yield {
+            "author": f"Client {seed}-{i}", "role": rng.choice(["CTO", "Founder", "Manager"]),
+            "content": _text(rng, corpus, 250), "featured": rng.random() < 0.2,
+        }
+
+
+def synthetic_services(rng, count, corpus, seed):
+    for i in range(count):
+        yield {
+            "title": _title(rng), "subtitle": _title(rng), "description": _text(rng, corpus, 300),
+            "active": rng.random() < 0.9,
+        }
+
+
+def synthetic_contacts(rng, count, corpus, seed):
+    for i in range(count):
+        yield {
+            "name": f"Visitor {i}", "email": f"visitor{seed}-{i}@example.com", "subject": _title(rng),
+            "message": _text(rng, corpus, 500), "is_read": rng.random() < 0.7, "created_at": _created(rng),
+        }
+
+
+SYNTHETIC = {
+    "posts": (Post, synthetic_posts),
+    "projects": (Project, synthetic_projects),
+    "skills": (Skill, synthetic_skills),
+    "experience": (Experience, synthetic_experience),
+    "testimonials": (Testimonial, synthetic_testimonials),
+    "services": (Service, synthetic_services),
+    "contacts": (Contact, synthetic_contacts),
+}
+
+
+async def seed_synthetic(counts: dict, seed: int, chunk_size: int, index: bool = True):
+    corpus = _corpus(random.Random(seed))
+    total_rows = 0
+    started = time.perf_counter()
+    for name, count in counts.items():
+        if count <= 0:
+            continue
+        model, generate = SYNTHETIC[name]
+        rng = random.Random(f"{seed}:{name}")
+        rows = generate(rng, count, corpus, seed)
+        table_started = time.perf_counter()
+        async with engine.begin() as conn:
+            while chunk := list(islice(rows, chunk_size)):
+                await conn.execute(insert(model.__table__), chunk)
+            # Core inserts on a bare connection bypass the session tracking
+            await versions.bump(conn, [model.__tablename__])
+        elapsed = time.perf_counter() - table_started
+        total_rows += count
+        print(f"{name:<13} {count:>9} rows {elapsed:>8.2f}s {count / elapsed:>10.0f} rows/s")
+
+    if index:
+        index_started = time.perf_counter()
+        async with AsyncSessionLocal() as session:
+            documents = await search.rebuild(session)
+            tag_rows = await tags.rebuild(session)
+            await session.commit()
+        print(f"{'indexes':<13} {documents:>9} docs, {tag_rows} tags {time.perf_counter() - index_started:.2f}s")
+
+    elapsed = time.perf_counter() - started
+    print(f"{'total':<13} {total_rows:>9} rows {elapsed:>8.2f}s {total_rows / elapsed:>10.0f} rows/s")
+
+
 async def main():
+    parser = argparse.ArgumentParser(description="Create the tables and seed demo content.")
+    parser.add_argument("--synthetic", action="store_true", help="generate N rows per model for load testing")
+    for name, count in DEFAULT_COUNTS.items():
+        parser.add_argument(f"--{name}", type=int, default=count, help=f"synthetic rows (default {count})")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--skip-index", action="store_true", help="don't rebuild the search and tag indexes")
+    args = parser.parse_args()
+
     print("Creating tables...")
     await create_tables()
-    print("Seeding data...")
-    await seed()
+    if args.synthetic:
+        counts = {name: getattr(args, name) for name in DEFAULT_COUNTS}
+        print(f"Generating synthetic data (seed {args.seed})...")
+        await seed_synthetic(counts, args.seed, args.chunk_size, index=not args.skip_index)
+    else:
+        print("Seeding data...")
+        await seed()
+    await engine.dispose()
     print("Done.")
 
 
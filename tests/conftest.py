@@ -0,0 +1,35 @@
+import os
+import tempfile
+
+import pytest
+
+# Settings are read at import time: point the app at a throwaway database first
+_data_dir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_data_dir}/test.db")
+os.environ.setdefault("UPLOAD_DIR", f"{_data_dir}/uploads")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from main import app  # noqa: E402
+
+ADMIN_PASSWORD = "test-password"
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    client.post(
+        "/api/auth/register",
+        json={"email": settings.ADMIN_EMAIL, "password": ADMIN_PASSWORD, "full_name": "Admin"},
+    )
+    response = client.post(
+        "/api/auth/login",
+        data={"username": settings.ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,30 @@
+import pytest
+
+SAMPLES = {
+    "/api/services": {"title": "Consulting"},
+    "/api/testimonials": {"author": "Ada", "content": "Great work"},
+}
+
+
+@pytest.mark.parametrize("prefix", sorted(SAMPLES))
+def test_batch_routes_require_admin(client, prefix):
+    item = SAMPLES[prefix]
+
+    assert client.post(f"{prefix}/batch", json=[item]).status_code == 401
+    assert client.put(f"{prefix}/batch", json=[{"id": 1, **item}]).status_code == 401
+    assert client.post(f"{prefix}/batch/delete", json={"ids": [1]}).status_code == 401
+
+
+@pytest.mark.parametrize("prefix", sorted(SAMPLES))
+def test_batch_routes_accept_admin(client, admin_headers, prefix):
+    item = SAMPLES[prefix]
+
+    created = client.post(f"{prefix}/batch", json=[item], headers=admin_headers)
+    assert created.status_code == 201
+    item_id = created.json()[0]["id"]
+
+    updated = client.put(f"{prefix}/batch", json=[{"id": item_id, **item}], headers=admin_headers)
+    assert updated.status_code == 200
+
+    deleted = client.post(f"{prefix}/batch/delete", json={"ids": [item_id]}, headers=admin_headers)
+    assert deleted.status_code == 200
@@ -0,0 +1,75 @@
+import asyncio
+import gzip
+import json
+
+from app.core.compression import CompressedMemo, CompressionMiddleware
+
+
+def _app(bodies):
+    """ASGI app answering each request with the next body under one fixed ETag."""
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"etag", b'"same"'),
+                (b"cache-control", b"public, max-age=60"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": bodies.pop(0)})
+    return app
+
+
+def _get(middleware):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "path": "/api/items", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(middleware(scope, receive, send))
+    return messages[0], messages[1]["body"]
+
+
+def test_memo_keyed_on_body_not_etag():
+    first = json.dumps({"name": "old" * 100}).encode()
+    second = json.dumps({"name": "new" * 100}).encode()
+    middleware = CompressionMiddleware(_app([first, second, second]), memo=CompressedMemo(), minimum_size=0)
+
+    start, body = _get(middleware)
+    assert gzip.decompress(body) == first
+    start, body = _get(middleware)
+    assert dict(start["headers"])[b"content-encoding"] == b"gzip"
+    assert gzip.decompress(body) == second
+
+    hits = middleware.memo.hits
+    _, body = _get(middleware)
+    assert gzip.decompress(body) == second
+    assert middleware.memo.hits == hits + 1
+
+
+def test_rename_within_the_same_second(client, admin_headers):
+    created = client.post(
+        "/api/skills",
+        json={"name": "Old name " + "x" * 2000, "category": "test"},
+        headers=admin_headers,
+    )
+    assert created.status_code == 200
+
+    first = client.get("/api/skills", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    client.put(
+        f"/api/skills/{created.json()['id']}",
+        json={"name": "New name " + "x" * 2000},
+        headers=admin_headers,
+    )
+    second = client.get("/api/skills", headers={"Accept-Encoding": "gzip"})
+
+    assert second.headers["content-encoding"] == "gzip"
+    names = [skill["name"] for skill in second.json()["data"]]
+    assert "New name " + "x" * 2000 in names
+    assert "Old name " + "x" * 2000 not in names
@@ -0,0 +1,26 @@
+def test_batch_update_rejects_slug_collisions(client, admin_headers):
+    created = client.post(
+        "/api/projects/batch",
+        json=[{"title": "Slug Gamma"}, {"title": "Slug Delta"}, {"title": "Slug Epsilon"}],
+        headers=admin_headers,
+    )
+    assert created.status_code == 200
+    gamma, delta, epsilon = (project["id"] for project in created.json())
+
+    # Clashes with another project's slug
+    response = client.put("/api/projects/batch", json=[{"id": delta, "title": "Slug Gamma"}], headers=admin_headers)
+    assert response.status_code == 400
+    assert "slug-gamma" in response.json()["detail"]
+
+    # Clashes within the batch
+    response = client.put(
+        "/api/projects/batch",
+        json=[{"id": delta, "title": "Same"}, {"id": epsilon, "title": "Same"}],
+        headers=admin_headers,
+    )
+    assert response.status_code == 400
+
+    # Keeping a project's own slug is fine
+    response = client.put("/api/projects/batch", json=[{"id": gamma, "title": "Slug Gamma"}], headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json() == [{"id": gamma, "status": "updated"}]
@@ -0,0 +1,66 @@
+import asyncio
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from app.core.storage import FORM_OVERHEAD, UploadLimitMiddleware
+
+MAX_SIZE = 1024
+
+app = FastAPI()
+app.add_middleware(UploadLimitMiddleware, prefixes=["/upload"], max_size=MAX_SIZE)
+
+
+@app.post("/upload")
+async def upload(file: UploadFile = File(...)):
+    return {"size": len(await file.read())}
+
+
+client = TestClient(app)
+
+
+def test_accepts_upload_within_limit():
+    response = client.post("/upload", files={"file": ("a.txt", b"x" * MAX_SIZE)})
+    assert response.status_code == 200
+    assert response.json() == {"size": MAX_SIZE}
+
+
+def test_refuses_declared_length_before_reading_body():
+    reads, sent = [], []
+
+    async def receive():
+        reads.append(1)
+        return {"type": "http.request", "body": b"", "more_body": True}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/upload",
+        "raw_path": b"/upload",
+        "root_path": "",
+        "scheme": "http",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", b"multipart/form-data; boundary=b"),
+            (b"content-length", str(MAX_SIZE + FORM_OVERHEAD + 1).encode()),
+        ],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+    assert sent[0]["status"] == 400
+    assert reads == []
+
+
+def test_refuses_streamed_body_past_limit():
+    def body():
+        yield b"--b\r\nContent-Disposition: form-data; name=\"file\"; filename=\"a.txt\"\r\n\r\n"
+        for _ in range(100):
+            yield b"x" * 1024
+
+    response = client.post("/upload", content=body(), headers={"Content-Type": "multipart/form-data; boundary=b"})
+    assert response.status_code == 400
+    assert "File too large" in response.json()["detail"]